@@ -0,0 +1,64 @@
+-- SEVDO AI chat - move legacy JSONB histories into ai_messages
+-- Databases created before ai_messages stored each conversation's history in
+-- ai_conversations.messages (JSONB NOT NULL, no default). The model no longer
+-- maps that column, so new conversations fail its NOT NULL constraint until
+-- this script has run.
+--
+-- Run once, after the app has started (create_all creates ai_messages):
+--   psql "$DB_URL" -f migrations/ai_messages_backfill.sql
+-- It runs in one transaction and is safe to re-run: once the column is gone
+-- only the timestamp default below is (re)applied.
+
+BEGIN;
+
+-- Malformed legacy timestamps fall back to the conversation's created_at
+-- instead of aborting the backfill
+CREATE FUNCTION pg_temp.try_timestamptz(value TEXT)
+RETURNS TIMESTAMPTZ AS $$
+BEGIN
+    RETURN value::TIMESTAMPTZ;
+EXCEPTION WHEN OTHERS THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ai_messages tables created before timestamp moved to a server default
+ALTER TABLE ai_messages ALTER COLUMN timestamp SET DEFAULT NOW();
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'ai_conversations'
+          AND column_name = 'messages'
+    ) THEN
+        RAISE NOTICE 'ai_conversations.messages already dropped, nothing to do';
+        RETURN;
+    END IF;
+
+    -- Copy every history in its original order; ids follow that order
+    INSERT INTO ai_messages
+        (conversation_id, role, content, timestamp, suggested_features)
+    SELECT
+        c.id,
+        left(COALESCE(m.value ->> 'role', 'user'), 20),
+        COALESCE(m.value ->> 'content', ''),
+        COALESCE(
+            pg_temp.try_timestamptz(m.value ->> 'timestamp') AT TIME ZONE 'UTC',
+            c.created_at
+        ),
+        m.value -> 'suggested_features'
+    FROM ai_conversations AS c
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(c.messages) = 'array'
+             THEN c.messages ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS m(value, n)
+    ORDER BY c.id, m.n;
+
+    ALTER TABLE ai_conversations DROP COLUMN messages;
+
+    RAISE NOTICE 'Legacy chat histories moved to ai_messages';
+END $$;
+
+COMMIT;
@@ -5,83 +5,332 @@ Playground Server for Frontend DSL Compiler
 This server provides a development environment for testing frontend applications
 using the DSL compiler. It automatically watches for changes in input_files/
 and recompiles them to JSX, then serves them as a web application.
+
+File watching uses inotify where available. When input_files/ lives on a
+network filesystem (NFS, CIFS, sshfs), inotify misses remote writes, so the
+server falls back to polling the directory once per second. Set
+PLAYGROUND_WATCHER=poll or PLAYGROUND_WATCHER=inotify to override detection.
+
+The server must run as a single worker process: the file watcher, compile
+cache and WebSocket client registry all live in process memory.
 """
 
 import os
+import re
+import string
 import sys
 import time
 import json
 import asyncio
+import hashlib
+import importlib.util
 import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.websockets import WebSocket, WebSocketDisconnect
 import websockets
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+try:
+    # Linux-only; lets the watcher run on the event loop instead of a thread
+    from asyncinotify import Inotify, Mask
+except ImportError:
+    Inotify = None
+
 # Add the parent directory to Python path to import frontend_compiler
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sevdo_frontend.frontend_compiler import dsl_to_jsx, load_prefabs
+from sevdo_frontend.frontend_compiler import COMPONENT_REGISTRY, dsl_to_jsx, load_prefabs
 
 # Configuration
 INPUT_DIR = Path(__file__).parent / "input_files"
 OUTPUT_DIR = Path(__file__).parent / "output_files"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 TEMPLATE_INPUT_DIR = Path(__file__).parent.parent / "templates"  # Points to the main templates directory
+FRONTEND_COMPILER_DIR = Path(__file__).parent.parent / "sevdo_frontend"
+COMPILE_CACHE_FILE = OUTPUT_DIR / ".compile_cache.json"
+DEFAULTS_SENTINEL = INPUT_DIR / ".defaults_written"
 
 # Ensure directories exist
 INPUT_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Extracts the markup returned by a compiled component
+_RETURN_RE = re.compile(r"return \((.*?)\);", re.DOTALL)
+_UNPARSABLE_BODY = "<div>Error parsing component</div>"
+
+# Window used to coalesce bursts of change events (editors emit several per save)
+CHANGE_DEBOUNCE_SECONDS = 0.05
+
+# Filesystems on which inotify does not see changes made by other hosts
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "fuse.sshfs"}
+POLL_INTERVAL_SECONDS = 1.0
+
+# Connected browsers beyond this are turned away with 1013 (Try Again Later)
+MAX_WS_CLIENTS = 256
+WS_MAX_MESSAGE_BYTES = 2**20
+HTTP_LIMIT_CONCURRENCY = 1024
+
+# Pending notifications per WebSocket client before it counts as too slow
+CLIENT_QUEUE_SIZE = 16
+
+# Application-level heartbeat so dead peers surface as failed writes
+HEARTBEAT_INTERVAL_SECONDS = 30
+HEARTBEAT_PAYLOAD = orjson.dumps({"type": "ping"}).decode("utf-8")
+
+# Protocol-level ping/pong handled by uvicorn
+WS_PING_INTERVAL_SECONDS = 20
+WS_PING_TIMEOUT_SECONDS = 20
+
+
+@dataclass(eq=False)
+class Client:
+    """A connected WebSocket client and its bounded outbound queue."""
+
+    ws: WebSocket
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    )
+    writer: Optional[asyncio.Task] = None
+    closed: asyncio.Event = field(default_factory=asyncio.Event)
+    close_code: Optional[int] = None
+
+
 # Global state for file watching
-file_change_connections: List[WebSocket] = []
+file_change_connections: Set[Client] = set()
 observer: Optional[Observer] = None
+watcher_task: Optional[asyncio.Task] = None
+
+# Input path -> {"size", "mtime_ns", "hash", "prefabs"} of its last successful compile
+_compile_cache: Dict[str, Dict] = {}
+_prefab_version = ""
+
+# Cached listings served by "/" and "/files", keyed by file stem. The watcher
+# keeps them current; a full rescan after META_TTL_SECONDS catches missed events.
+META_TTL_SECONDS = 5.0
+_meta: Dict[str, Dict] = {}
+_output_meta: Dict[str, Dict] = {}
+_meta_built_at = 0.0
+
+# Worker processes for bulk compiles; created on first use
+_compile_pool: Optional[ProcessPoolExecutor] = None
 
 
 class FileChangeHandler(FileSystemEventHandler):
-    """Handles file system events for input files."""
+    """Handles file system events for input files.
+
+    Fallback used when asyncinotify is unavailable. Runs on the watchdog
+    thread, so it only hands changed paths over to the server's event loop;
+    compilation and notification happen in _drain_changes.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, change_q: asyncio.Queue):
+        super().__init__()
+        self.loop = loop
+        self.change_q = change_q
+
+    def _enqueue(self, path: str):
+        self.loop.call_soon_threadsafe(self.change_q.put_nowait, Path(path))
 
     def on_modified(self, event):
         if not event.is_directory and event.src_path.endswith(".txt"):
             print(f"File changed: {event.src_path}")
-            compile_file(Path(event.src_path))
-            # Notify all connected clients
-            asyncio.run(notify_clients())
+            self._enqueue(event.src_path)
 
     def on_created(self, event):
         if not event.is_directory and event.src_path.endswith(".txt"):
             print(f"File created: {event.src_path}")
-            compile_file(Path(event.src_path))
-            asyncio.run(notify_clients())
+            self._enqueue(event.src_path)
 
+    def on_deleted(self, event):
+        if not event.is_directory and event.src_path.endswith(".txt"):
+            print(f"File deleted: {event.src_path}")
+            self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, event.dest_path):
+            if path.endswith(".txt"):
+                print(f"File moved: {path}")
+                self._enqueue(path)
+
+
+def _compute_prefab_version() -> str:
+    """Fingerprint the compiler and prefab sources so their edits invalidate the cache."""
+    sources = [FRONTEND_COMPILER_DIR / "frontend_compiler.py"]
+    sources.extend(sorted((FRONTEND_COMPILER_DIR / "prefabs").glob("*.py")))
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sources:
+        try:
+            st = source.stat()
+        except OSError:
+            continue
+        digest.update(f"{source.name}:{st.st_size}:{st.st_mtime_ns};".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_compile_cache():
+    """Load the persisted compile cache, discarding it if the prefabs changed."""
+    global _prefab_version
+    _prefab_version = _compute_prefab_version()
+    _compile_cache.clear()
+    try:
+        data = json.loads(COMPILE_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if isinstance(data, dict):
+        _compile_cache.update(
+            (path, entry)
+            for path, entry in data.items()
+            if isinstance(entry, dict)
+            and entry.get("prefabs") == _prefab_version
+            and Path(path).exists()
+        )
 
-def compile_file(input_path: Path):
-    """Compile a single DSL file to JSX."""
+
+def save_compile_cache():
+    """Persist the compile cache so warm restarts skip unchanged files."""
     try:
-        # Read the DSL content
-        dsl_content = input_path.read_text(encoding="utf-8")
-
-        # Generate component name from filename (sanitize for JavaScript)
-        base_name = input_path.stem
-        # Replace spaces and special chars with underscores, capitalize each word
-        component_name = (
-            "".join(
-                word.title()
-                for word in base_name.replace(" ", "_").replace("-", "_").split("_")
-                if word
-            )
-            + "Component"
+        COMPILE_CACHE_FILE.write_text(json.dumps(_compile_cache), encoding="utf-8")
+    except OSError as e:
+        print(f"Could not save compile cache: {e}")
+
+
+def _extract_jsx_body(jsx_content: str) -> str:
+    """Return the JSX inside a component's `return (...)`."""
+    return_match = _RETURN_RE.search(jsx_content)
+    return return_match.group(1).strip() if return_match else _UNPARSABLE_BODY
+
+
+def _body_path(jsx_file: Path) -> Path:
+    """Sidecar holding the pre-extracted body of a compiled component."""
+    return jsx_file.with_name(jsx_file.name + ".body")
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write bytes through a raw fd, skipping the text-layer setup of write_text."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data unless the file already holds it, keeping mtime (and ETags) stable."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, data)
+    return True
+
+
+def _write_jsx(output_path: Path, jsx_content: str):
+    """Write a compiled component plus its extracted body for the view endpoints."""
+    body = _extract_jsx_body(jsx_content).encode("utf-8")
+    if _write_if_changed(output_path, jsx_content.encode("utf-8")):
+        # Keep the sidecar at least as new as the .jsx so _read_jsx_body trusts it
+        _write_bytes(_body_path(output_path), body)
+    else:
+        _write_if_changed(_body_path(output_path), body)
+
+
+def _read_jsx_body(jsx_file: Path) -> str:
+    """Read a component's body, parsing the .jsx only when no fresh sidecar exists."""
+    body_file = _body_path(jsx_file)
+    try:
+        if body_file.stat().st_mtime_ns >= jsx_file.stat().st_mtime_ns:
+            return body_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+    return _extract_jsx_body(jsx_file.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=1024)
+def _component_name(stem: str) -> str:
+    """Generate a component name from a filename (sanitized for JavaScript)."""
+    # Replace spaces and special chars with underscores, capitalize each word
+    return (
+        "".join(
+            word.title()
+            for word in stem.replace(" ", "_").replace("-", "_").split("_")
+            if word
         )
+        + "Component"
+    )
+
+
+def _decode_dsl(data: bytes) -> str:
+    """Decode DSL source with the newline handling read_text would apply."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _compile_file_job(
+    input_path: Path, cached: Optional[Dict], prefab_version: str
+) -> Tuple[bool, Optional[Dict]]:
+    """Compile a single DSL file to JSX and return (success, cache entry).
+
+    Files whose size/mtime or content hash match the cached entry (with the
+    same prefab version) are skipped when their output still exists. Does not
+    touch module state, so it can run in a pool worker process.
+    """
+    try:
+        output_path = OUTPUT_DIR / f"{input_path.stem}.jsx"
+        st = input_path.stat()
+        if cached and cached.get("prefabs") != prefab_version:
+            cached = None
+        if (
+            cached
+            and cached["size"] == st.st_size
+            and cached["mtime_ns"] == st.st_mtime_ns
+            and output_path.exists()
+        ):
+            return True, cached
+
+        # Read the DSL content; hash the raw bytes so skips never decode
+        dsl_bytes = input_path.read_bytes()
+        content_hash = hashlib.blake2b(dsl_bytes, digest_size=16).hexdigest()
+        cache_entry = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "hash": content_hash,
+            "prefabs": prefab_version,
+        }
+        if cached and cached["hash"] == content_hash and output_path.exists():
+            return True, cache_entry
+
+        dsl_content = _decode_dsl(dsl_bytes)
+
+        component_name = _component_name(input_path.stem)
 
         # Compile to JSX
         jsx_content = dsl_to_jsx(
@@ -89,23 +338,74 @@ def compile_file(input_path: Path):
         )
 
         # Write to output file
-        output_path = OUTPUT_DIR / f"{input_path.stem}.jsx"
-        output_path.write_text(jsx_content, encoding="utf-8")
+        _write_jsx(output_path, jsx_content)
 
         print(f"Compiled {input_path} -> {output_path}")
-        return True
+        return True, cache_entry
 
     except Exception as e:
         print(f"Error compiling {input_path}: {e}")
-        return False
+        return False, None
+
+
+def _record_compile_result(input_path: Path, result: Tuple[bool, Optional[Dict]]):
+    """Store a compile job's cache entry and return whether it succeeded."""
+    success, cache_entry = result
+    if cache_entry is not None:
+        _compile_cache[str(input_path)] = cache_entry
+    return success
+
+
+def compile_file(input_path: Path):
+    """Compile a single DSL file to JSX."""
+    result = _compile_file_job(
+        input_path, _compile_cache.get(str(input_path)), _prefab_version
+    )
+    return _record_compile_result(input_path, result)
+
+
+def _compile_worker_init():
+    """Register prefabs in a pool worker (forked workers inherit them already)."""
+    if not COMPONENT_REGISTRY:
+        load_prefabs()
+
+
+def _get_compile_pool() -> ProcessPoolExecutor:
+    global _compile_pool
+    if _compile_pool is None:
+        _compile_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_compile_worker_init
+        )
+    return _compile_pool
+
+
+def shutdown_compile_pool():
+    """Stop the compile worker processes."""
+    global _compile_pool
+    if _compile_pool is not None:
+        _compile_pool.shutdown(cancel_futures=True)
+        _compile_pool = None
 
 
 def compile_all_files():
-    """Compile all DSL files in input directory."""
-    compiled_count = 0
-    for input_file in INPUT_DIR.glob("*.txt"):
-        if compile_file(input_file):
-            compiled_count += 1
+    """Compile all DSL files in input directory, in parallel worker processes."""
+    input_files = list(INPUT_DIR.glob("*.txt"))
+    if len(input_files) <= 1:
+        # Not worth the process round trip
+        compiled_count = sum(compile_file(f) for f in input_files)
+    else:
+        pool = _get_compile_pool()
+        futures = {
+            pool.submit(
+                _compile_file_job, f, _compile_cache.get(str(f)), _prefab_version
+            ): f
+            for f in input_files
+        }
+        compiled_count = sum(
+            _record_compile_result(futures[future], future.result())
+            for future in as_completed(futures)
+        )
+    save_compile_cache()
     print(f"Compiled {compiled_count} files")
     return compiled_count
 
@@ -130,7 +430,7 @@ def compile_template_page(template_name: str, page_file: Path):
     """Compile a single template page."""
     try:
         # Read the DSL content
-        dsl_content = page_file.read_text(encoding="utf-8")
+        dsl_content = _decode_dsl(page_file.read_bytes())
 
         # Generate component name from template and page
         page_name = page_file.stem
@@ -147,7 +447,7 @@ def compile_template_page(template_name: str, page_file: Path):
 
         # Write to output file
         output_path = template_output_dir / f"{page_name}.jsx"
-        output_path.write_text(jsx_content, encoding="utf-8")
+        _write_jsx(output_path, jsx_content)
 
         print(f"Compiled {page_file} -> {output_path}")
         return True
@@ -173,28 +473,169 @@ def compile_all_templates():
     return compiled_count
 
 
+async def compile_all_files_async():
+    """Compile all DSL files in the worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _get_compile_pool()
+    input_files = await asyncio.to_thread(lambda: list(INPUT_DIR.glob("*.txt")))
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                pool, _compile_file_job, f, _compile_cache.get(str(f)), _prefab_version
+            )
+            for f in input_files
+        )
+    )
+    compiled_count = sum(
+        _record_compile_result(f, result) for f, result in zip(input_files, results)
+    )
+    save_compile_cache()
+    print(f"Compiled {compiled_count} files")
+    return compiled_count
+
+
 async def notify_clients():
-    """Notify all connected WebSocket clients of file changes."""
-    message = {"type": "files_changed", "timestamp": time.time()}
-    disconnected = []
+    """Notify all connected WebSocket clients of file changes.
 
-    for ws in file_change_connections:
+    Only enqueues the message; each client's writer task does the network
+    write, so one slow browser cannot delay the others.
+    """
+    # Serialize once; the browser client parses text frames with JSON.parse
+    payload = orjson.dumps({"type": "files_changed", "timestamp": time.time()})
+    payload = payload.decode("utf-8")
+    too_slow = []
+    for client in file_change_connections:
         try:
-            await ws.send_json(message)
-        except Exception:
-            disconnected.append(ws)
+            client.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            too_slow.append(client)
+
+    for client in too_slow:
+        print("Dropping WebSocket client that stopped reading notifications")
+        _drop_client(client, close_code=1013)
+
+
+def _drop_client(client: Client, close_code: Optional[int] = None):
+    """Forget a client and release its websocket_endpoint coroutine."""
+    file_change_connections.discard(client)
+    if client.writer is not None:
+        client.writer.cancel()
+    if close_code is not None and client.close_code is None:
+        client.close_code = close_code
+    client.closed.set()
 
-    # Remove disconnected clients
-    for ws in disconnected:
-        if ws in file_change_connections:
-            file_change_connections.remove(ws)
 
+async def _client_writer(client: Client):
+    """Send a client's queued notifications until a write fails."""
+    try:
+        while True:
+            payload = await client.queue.get()
+            await client.ws.send_text(payload)
+    except Exception:
+        file_change_connections.discard(client)
+        client.closed.set()
+
+
+async def _heartbeat(client: Client):
+    """Queue a ping frame periodically; the browser ignores it."""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            client.queue.put_nowait(HEARTBEAT_PAYLOAD)
+        except asyncio.QueueFull:
+            pass  # notify_clients drops clients that stay backed up
 
-def start_file_watcher():
+
+def _apply_change(input_path: Path):
+    """Compile a changed input file, or forget it if it was deleted."""
+    if input_path.exists():
+        compile_file(input_path)
+    else:
+        _compile_cache.pop(str(input_path), None)
+    _update_meta(input_path)
+
+
+async def _drain_changes(change_q: asyncio.Queue):
+    """Compile changed files in debounced batches and notify clients once per batch."""
+    while True:
+        paths = {await change_q.get()}
+        try:
+            while True:
+                paths.add(
+                    await asyncio.wait_for(change_q.get(), CHANGE_DEBOUNCE_SECONDS)
+                )
+        except asyncio.TimeoutError:
+            pass
+
+        await asyncio.gather(*(asyncio.to_thread(_apply_change, p) for p in paths))
+        save_compile_cache()
+        await notify_clients()
+
+
+def _is_network_fs(path: Path) -> bool:
+    """Return True if path lives on a network filesystem, per /proc/self/mounts."""
+    try:
+        mounts = Path("/proc/self/mounts").read_text(encoding="utf-8")
+    except OSError:
+        return False  # Not Linux; nothing to detect
+
+    target = str(path.resolve())
+    best_mount, best_type = "", ""
+    for line in mounts.splitlines():
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Spaces in mount points are octal-escaped in /proc/self/mounts
+        mount_point = fields[1].replace("\\040", " ")
+        is_prefix = target == mount_point or target.startswith(
+            mount_point.rstrip("/") + "/"
+        )
+        if is_prefix and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+
+    return best_type in NETWORK_FS_TYPES
+
+
+def _use_polling_watcher() -> bool:
+    """Decide whether INPUT_DIR must be polled instead of watched via inotify."""
+    mode = os.environ.get("PLAYGROUND_WATCHER", "").strip().lower()
+    if mode == "poll":
+        return True
+    if mode == "inotify":
+        return False
+    return _is_network_fs(INPUT_DIR)
+
+
+async def watch_inputs(change_q: asyncio.Queue):
+    """Watch INPUT_DIR with inotify and queue every written, moved or deleted DSL file."""
+    with Inotify() as inotify:
+        # CLOSE_WRITE fires once per save, unlike the several MODIFY events
+        # editors produce while writing a file
+        inotify.add_watch(
+            INPUT_DIR,
+            Mask.CLOSE_WRITE | Mask.MOVED_TO | Mask.MOVED_FROM | Mask.DELETE,
+        )
+        async for event in inotify:
+            if event.path is not None and event.path.suffix == ".txt":
+                print(f"File changed: {event.path}")
+                await change_q.put(event.path)
+
+
+def start_file_watcher(loop: asyncio.AbstractEventLoop, change_q: asyncio.Queue):
     """Start the file system watcher."""
-    global observer
-    event_handler = FileChangeHandler()
-    observer = Observer()
+    global observer, watcher_task
+    polling = _use_polling_watcher()
+    if Inotify is not None and not polling:
+        watcher_task = loop.create_task(watch_inputs(change_q))
+        print(f"Started watching {INPUT_DIR} (inotify)")
+        return
+
+    event_handler = FileChangeHandler(loop, change_q)
+    if polling:
+        observer = PollingObserver(timeout=POLL_INTERVAL_SECONDS)
+        print(f"Polling {INPUT_DIR} every {POLL_INTERVAL_SECONDS}s")
+    else:
+        observer = Observer()
     observer.schedule(event_handler, str(INPUT_DIR), recursive=False)
     observer.start()
     print(f"Started watching {INPUT_DIR}")
@@ -202,7 +643,11 @@ def start_file_watcher():
 
 def stop_file_watcher():
     """Stop the file system watcher."""
-    global observer
+    global observer, watcher_task
+    if watcher_task:
+        watcher_task.cancel()
+        watcher_task = None
+        print("Stopped file watcher")
     if observer:
         observer.stop()
         observer.join()
@@ -213,16 +658,24 @@ def stop_file_watcher():
 async def lifespan(app: FastAPI):
     # Startup
     load_prefabs()
+    load_compile_cache()
     compile_all_files()
     compile_all_templates()
-    start_file_watcher()
+    _rebuild_meta()
+    loop = asyncio.get_running_loop()
+    change_q: asyncio.Queue = asyncio.Queue()
+    consumer_task = loop.create_task(_drain_changes(change_q))
+    start_file_watcher(loop, change_q)
     yield
     # Shutdown
     stop_file_watcher()
+    consumer_task.cancel()
+    save_compile_cache()
+    shutdown_compile_pool()
 
 
 # Create FastAPI app
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory=str(OUTPUT_DIR)), name="static")
@@ -231,22 +684,98 @@ app.mount("/static", StaticFiles(directory=str(OUTPUT_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 
+def _input_entry(f: Path) -> Dict:
+    output_file = OUTPUT_DIR / f"{f.stem}.jsx"
+    return {
+        "name": f.stem,
+        "input_path": str(f),
+        "output_path": str(output_file),
+        "exists": output_file.exists(),
+        "last_modified": f.stat().st_mtime if f.exists() else 0,
+    }
+
+
+def _output_entry(f: Path) -> Dict:
+    return {"name": f.stem, "path": str(f), "last_modified": f.stat().st_mtime}
+
+
+def _rebuild_meta():
+    """Rescan both directories and replace the cached listings.
+
+    One scandir pass per directory; output existence comes from the output
+    listing instead of a stat per input file.
+    """
+    global _meta, _output_meta, _meta_built_at
+    output_meta = {}
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".jsx") and entry.is_file():
+                stem = entry.name[: -len(".jsx")]
+                output_meta[stem] = {
+                    "name": stem,
+                    "path": entry.path,
+                    "last_modified": entry.stat().st_mtime,
+                }
+
+    meta = {}
+    with os.scandir(INPUT_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".txt") and entry.is_file():
+                stem = entry.name[: -len(".txt")]
+                meta[stem] = {
+                    "name": stem,
+                    "input_path": entry.path,
+                    "output_path": str(OUTPUT_DIR / f"{stem}.jsx"),
+                    "exists": stem in output_meta,
+                    "last_modified": entry.stat().st_mtime,
+                }
+
+    _meta, _output_meta = meta, output_meta
+    _meta_built_at = time.monotonic()
+
+
+def _update_meta(input_path: Path):
+    """Refresh the cached listing entries for one input file and its output."""
+    stem = input_path.stem
+    output_file = OUTPUT_DIR / f"{stem}.jsx"
+    if input_path.exists():
+        _meta[stem] = _input_entry(input_path)
+    else:
+        _meta.pop(stem, None)
+    if output_file.exists():
+        _output_meta[stem] = _output_entry(output_file)
+    else:
+        _output_meta.pop(stem, None)
+
+
+def _invalidate_meta():
+    """Force the next listing request to rescan both directories."""
+    global _meta_built_at
+    _meta_built_at = 0.0
+
+
+async def _refresh_meta_if_stale():
+    if time.monotonic() - _meta_built_at > META_TTL_SECONDS:
+        await asyncio.to_thread(_rebuild_meta)
+
+
+async def _scan_inputs() -> List[Dict]:
+    """Return the cached input listing, rescanning on a worker thread when stale."""
+    await _refresh_meta_if_stale()
+    return list(_meta.values())
+
+
+async def _scan_outputs() -> List[Dict]:
+    """Return the cached output listing, rescanning on a worker thread when stale."""
+    await _refresh_meta_if_stale()
+    return list(_output_meta.values())
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Serve the main playground interface."""
     # Get list of available files
-    input_files = []
-    for f in INPUT_DIR.glob("*.txt"):
-        output_file = OUTPUT_DIR / f"{f.stem}.jsx"
-        input_files.append(
-            {
-                "name": f.stem,
-                "input_path": str(f),
-                "output_path": str(output_file),
-                "exists": output_file.exists(),
-                "last_modified": f.stat().st_mtime if f.exists() else 0,
-            }
-        )
+    input_files = await _scan_inputs()
 
     return templates.TemplateResponse(
         "index.html",
@@ -262,24 +791,16 @@ async def home(request: Request):
 @app.get("/files")
 async def list_files():
     """API endpoint to list all input and output files."""
-    input_files = []
-    output_files = []
-
-    for f in INPUT_DIR.glob("*.txt"):
-        output_file = OUTPUT_DIR / f"{f.stem}.jsx"
-        input_files.append(
-            {
-                "name": f.stem,
-                "path": str(f),
-                "last_modified": f.stat().st_mtime,
-                "has_output": output_file.exists(),
-            }
-        )
-
-    for f in OUTPUT_DIR.glob("*.jsx"):
-        output_files.append(
-            {"name": f.stem, "path": str(f), "last_modified": f.stat().st_mtime}
-        )
+    input_files = [
+        {
+            "name": f["name"],
+            "path": f["input_path"],
+            "last_modified": f["last_modified"],
+            "has_output": f["exists"],
+        }
+        for f in await _scan_inputs()
+    ]
+    output_files = await _scan_outputs()
 
     return {"input_files": input_files, "output_files": output_files}
 
@@ -288,10 +809,11 @@ async def list_files():
 async def compile_single_file(filename: str):
     """API endpoint to manually compile a specific file."""
     input_path = INPUT_DIR / f"{filename}.txt"
-    if not input_path.exists():
+    if not await asyncio.to_thread(input_path.exists):
         raise HTTPException(status_code=404, detail="File not found")
 
-    success = compile_file(input_path)
+    success = await asyncio.to_thread(compile_file, input_path)
+    await asyncio.to_thread(_update_meta, input_path)
     if success:
         await notify_clients()
         return {"success": True, "message": f"Compiled {filename}"}
@@ -302,7 +824,8 @@ async def compile_single_file(filename: str):
 @app.post("/compile-all")
 async def compile_all():
     """API endpoint to compile all files."""
-    count = compile_all_files()
+    count = await compile_all_files_async()
+    _invalidate_meta()
     await notify_clients()
     return {"success": True, "message": f"Compiled {count} files"}
 
@@ -339,7 +862,7 @@ async def list_templates():
 @app.post("/api/templates/{template_name}/compile")
 async def compile_template_endpoint(template_name: str):
     """API endpoint to compile a specific template."""
-    success = compile_template(template_name)
+    success = await asyncio.to_thread(compile_template, template_name)
     if success:
         await notify_clients()
         return {"success": True, "message": f"Compiled template '{template_name}'"}
@@ -350,7 +873,7 @@ async def compile_template_endpoint(template_name: str):
 @app.post("/api/templates/compile-all")
 async def compile_all_templates_endpoint():
     """API endpoint to compile all templates."""
-    count = compile_all_templates()
+    count = await asyncio.to_thread(compile_all_templates)
     await notify_clients()
     return {"success": True, "message": f"Compiled {count} templates"}
 
@@ -359,78 +882,74 @@ async def compile_all_templates_endpoint():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time file change notifications."""
     await websocket.accept()
-    file_change_connections.append(websocket)
-
-    try:
-        while True:
-            # Keep connection alive
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        if websocket in file_change_connections:
-            file_change_connections.remove(websocket)
-
+    if len(file_change_connections) >= MAX_WS_CLIENTS:
+        print(f"Rejecting WebSocket client: {MAX_WS_CLIENTS} already connected")
+        await websocket.close(code=1013)
+        return
 
-@app.get("/view/{filename}")
-async def view_component(filename: str):
-    """Serve a specific compiled component."""
-    jsx_file = OUTPUT_DIR / f"{filename}.jsx"
-    if not jsx_file.exists():
-        raise HTTPException(status_code=404, detail="Component not found")
-
-    jsx_content = jsx_file.read_text(encoding="utf-8")
+    client = Client(websocket)
+    client.writer = asyncio.create_task(_client_writer(client))
+    heartbeat = asyncio.create_task(_heartbeat(client))
+    file_change_connections.add(client)
 
-    # Extract just the JSX return content
-    import re
+    try:
+        # The browser never sends anything; a disconnect shows up as a failed
+        # write in the writer task (uvicorn's ping/pong catches half-open peers)
+        await client.closed.wait()
+    finally:
+        heartbeat.cancel()
+        _drop_client(client)
+
+    if client.close_code is not None:
+        try:
+            await websocket.close(code=client.close_code)
+        except Exception:
+            pass
 
-    return_match = re.search(r"return \((.*?)\);", jsx_content, re.DOTALL)
-    jsx_body = (
-        return_match.group(1).strip()
-        if return_match
-        else "<div>Error parsing component</div>"
-    )
 
-    # Create a simple HTML wrapper for the JSX component
-    html_content = f"""
+# HTML wrapper for /view; only $filename and $jsx_body vary per request
+_VIEW_TEMPLATE = string.Template(
+    """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{filename} - Playground</title>
+        <title>$filename - Playground</title>
         <script crossorigin src="https://unpkg.com/react@18/umd/react.development.js"></script>
         <script crossorigin src="https://unpkg.com/react-dom@18/umd/react-dom.development.js"></script>
         <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
         <script src="https://cdn.tailwindcss.com"></script>
         <style>
-            body {{
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
                 margin: 0;
                 padding: 20px;
                 background-color: #f5f5f5;
-            }}
-            .component-container {{
+            }
+            .component-container {
                 max-width: 800px;
                 margin: 0 auto;
                 background: white;
                 padding: 20px;
                 border-radius: 8px;
                 box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="component-container">
-            <h2>{filename} Component</h2>
+            <h2>$filename Component</h2>
             <div id="root"></div>
         </div>
 
         <script type="text/babel">
             // Define the component with extracted JSX
-            function MyComponent() {{
+            function MyComponent() {
                 return (
-                    {jsx_body}
+                    $jsx_body
                 );
-            }}
+            }
 
             // Render the component
             const root = ReactDOM.createRoot(document.getElementById('root'));
@@ -439,8 +958,52 @@ async def view_component(filename: str):
     </body>
     </html>
     """
+)
+# Revalidate every time so live reloads never show a stale component
+VIEW_CACHE_CONTROL = "no-cache"
 
-    return HTMLResponse(html_content)
+
+@app.get("/view/{filename}")
+async def view_component(filename: str, request: Request):
+    """Serve a specific compiled component."""
+    jsx_file = OUTPUT_DIR / f"{filename}.jsx"
+    try:
+        st = await asyncio.to_thread(jsx_file.stat)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Component not found")
+
+    # The wrapper is deterministic per component, so its output mtime is a valid ETag
+    etag = f'"{st.st_mtime_ns:x}"'
+    headers = {"ETag": etag, "Cache-Control": VIEW_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    # Just the JSX return content
+    jsx_body = await asyncio.to_thread(_read_jsx_body, jsx_file)
+
+    html_content = _VIEW_TEMPLATE.substitute(filename=filename, jsx_body=jsx_body)
+    return HTMLResponse(html_content, headers=headers)
+
+
+@app.get("/raw/{filename}")
+async def raw_component(filename: str, request: Request):
+    """Serve a compiled component's JSX source straight from disk."""
+    jsx_file = OUTPUT_DIR / f"{filename}.jsx"
+    try:
+        st = await asyncio.to_thread(jsx_file.stat)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Component not found")
+
+    response = FileResponse(jsx_file, media_type="text/javascript", stat_result=st)
+    if request.headers.get("if-none-match") == response.headers["etag"]:
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": response.headers["etag"],
+                "Last-Modified": response.headers["last-modified"],
+            },
+        )
+    return response
 
 
 @app.get("/template/{template_name}")
@@ -475,16 +1038,7 @@ async def view_template(template_name: str):
 
     for i, page_name in enumerate(pages):
         jsx_file = template_output_dir / f"{page_name}.jsx"
-        jsx_content = jsx_file.read_text(encoding="utf-8")
-
-        # Extract JSX content
-        import re
-        return_match = re.search(r"return \((.*?)\);", jsx_content, re.DOTALL)
-        jsx_body = (
-            return_match.group(1).strip()
-            if return_match
-            else "<div>Error parsing component</div>"
-        )
+        jsx_body = _read_jsx_body(jsx_file)
 
         nav_items.append(f'<button class="nav-btn" onclick="showPage({i})">{page_name}</button>')
         page_components.append(f"""
@@ -621,9 +1175,23 @@ async def view_template(template_name: str):
     return HTMLResponse(html_content)
 
 
+def _server_options() -> Dict:
+    """Pick uvloop/httptools when installed (uvicorn[standard]), else asyncio/h11."""
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    return {
+        "loop": "uvloop" if has_uvloop else "asyncio",
+        "http": "httptools" if has_httptools else "h11",
+        "ws": "websockets",
+    }
+
+
 def create_default_files():
     """Create some default example files if the input directory is empty."""
-    if list(INPUT_DIR.glob("*.txt")):
+    if DEFAULTS_SENTINEL.exists():
+        return  # Already handled on an earlier start
+    if any(INPUT_DIR.glob("*.txt")):
+        DEFAULTS_SENTINEL.touch()
         return  # Don't create if files already exist
 
     examples = {
@@ -657,10 +1225,11 @@ b(View More Images)
     }
 
     for filename, content in examples.items():
-        file_path = INPUT_DIR / filename
-        file_path.write_text(content, encoding="utf-8")
+        _write_bytes(INPUT_DIR / filename, content.encode("utf-8"))
         print(f"Created example file: {filename}")
 
+    DEFAULTS_SENTINEL.touch()
+
 
 if __name__ == "__main__":
     # Create default example files if needed
@@ -677,5 +1246,11 @@ if __name__ == "__main__":
         host="localhost",
         port=8003,
         reload=False,  # We handle reloading ourselves
+        workers=1,  # Watcher and WebSocket clients are per-process state
+        **_server_options(),
+        ws_ping_interval=WS_PING_INTERVAL_SECONDS,
+        ws_ping_timeout=WS_PING_TIMEOUT_SECONDS,
+        ws_max_size=WS_MAX_MESSAGE_BYTES,
+        limit_concurrency=HTTP_LIMIT_CONCURRENCY,
         log_level="info",
     )
\ No newline at end of file
@@ -11,7 +11,7 @@ from pathlib import Path
 
 def check_dependencies():
     """Check if required packages are installed."""
-    required_packages = ["fastapi", "uvicorn", "watchdog", "jinja2"]
+    required_packages = ["fastapi", "uvicorn", "watchdog", "jinja2", "orjson"]
     missing_packages = []
 
     for package in required_packages:
@@ -1,29 +1,45 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import AbstractSet, List, Optional
 from pathlib import Path
 import os
+import re
+from collections import OrderedDict
 import threading
+import asyncio
 from time import time
-from hashlib import sha256
+from hashlib import blake2b, sha256
 import concurrent.futures as cf
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 imports = {
     "auth_imports": """
 from fastapi import FastAPI, Depends, HTTPException, Header
 from pydantic import BaseModel
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from typing import Generator, Optional
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+import concurrent.futures
 import uuid
 import os
 from dotenv import load_dotenv
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_pool()
+    yield
+
+
 # FastAPI app
-app = FastAPI(default_response_class=ORJSONResponse)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Load environment variables from a .env file if present
 load_dotenv()
@@ -37,18 +53,35 @@ DATABASE_URL = (
     f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+DB_POOL_SIZE = 5
+
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=5,
+    pool_size=DB_POOL_SIZE,
     max_overflow=10,
+    pool_use_lifo=True,
+    pool_recycle=1800,
+    pool_timeout=10,
     future=True,
 )
 
+def warm_pool():
+    # Open pool_size connections concurrently so the first burst skips the handshakes
+    def _touch(_):
+        with engine.connect():
+            pass
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DB_POOL_SIZE) as ex:
+        list(ex.map(_touch, range(DB_POOL_SIZE)))
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 Base = declarative_base()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id with OWASP's minimum recommended parameters (46 MiB, t=1, p=1)
+pwd_context = PasswordHasher(time_cost=1, memory_cost=46 * 1024, parallelism=1)
+# Apps generated before the Argon2 switch stored bcrypt hashes. Those are still
+# verified with bcrypt and rehashed with Argon2 on the user's next login.
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -70,8 +103,8 @@ class UserDB(Base):
 class SessionDB(Base):
     __tablename__ = "sessions"
     id = Column(String, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    expiry = Column(DateTime, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    expiry = Column(DateTime, nullable=False, index=True)
 
 # Auto-create tables on startup (dev convenience)
 Base.metadata.create_all(bind=engine)
@@ -97,11 +130,18 @@ def get_current_session(authorization: Optional[str] = Header(None, alias=TOKEN_
         raise HTTPException(status_code=401, detail="Invalid or expired session")
     return session
 
-def get_current_user(session: "SessionDB" = Depends(get_current_session),
+def get_current_user(authorization: Optional[str] = Header(None, alias=TOKEN_HEADER),
                      db: Session = Depends(get_db)) -> "UserDB":
-    user = db.query(UserDB).filter(UserDB.id == session.user_id).first()
+    # Session check and user lookup in one JOIN instead of two queries
+    token = extract_token(authorization)
+    user = (
+        db.query(UserDB)
+        .join(SessionDB, SessionDB.user_id == UserDB.id)
+        .filter(SessionDB.id == token, SessionDB.expiry >= datetime.utcnow())
+        .first()
+    )
     if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+        raise HTTPException(status_code=401, detail="Invalid or expired session")
     return user
         """
 }
@@ -118,8 +158,19 @@ def register_endpoint(user: User, db: Session = Depends(get_db)):
 @app.post("/login")
 def login_endpoint(user: User, db: Session = Depends(get_db)):
     db_user = db.query(UserDB).filter(UserDB.username == user.username).first()
-    if not db_user or not pwd_context.verify(user.password, db_user.password):
+    if not db_user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if db_user.password.startswith(BCRYPT_PREFIXES):
+        if not bcrypt.checkpw(user.password.encode("utf-8"), db_user.password.encode("utf-8")):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        db_user.password = pwd_context.hash(user.password)
+    else:
+        try:
+            pwd_context.verify(db_user.password, user.password)
+        except (VerificationError, InvalidHashError):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        if pwd_context.check_needs_rehash(db_user.password):
+            db_user.password = pwd_context.hash(user.password)
     session_id = str(uuid.uuid4())
     expiry = datetime.utcnow() + timedelta(hours=1)
     db.add(SessionDB(id=session_id, user_id=db_user.id, expiry=expiry))
@@ -150,7 +201,9 @@ def refresh_endpoint(session: SessionDB = Depends(get_current_session), db: Sess
     return {"session_token": new_session_id}""",
     "a": """@app.post("/logout-all")
 def logout_all_endpoint(current_user: UserDB = Depends(get_current_user), db: Session = Depends(get_db)):
-    db.query(SessionDB).filter(SessionDB.user_id == current_user.id).delete()
+    db.query(SessionDB).filter(SessionDB.user_id == current_user.id).delete(
+        synchronize_session=False
+    )
     db.commit()
     return {"msg": "Logged out of all sessions"}""",
     "s": """@app.get("/sessions")
@@ -167,6 +220,8 @@ def revoke_session_endpoint(id: str, current_user: UserDB = Depends(get_current_
     return {"msg": "Session revoked"}""",
 }
 
+_DECORATOR_RE = re.compile(r'@app\.(\w+)\("([^"]+)"\)')
+
 
 class BackendCompiler:
     def __init__(self):
@@ -174,42 +229,66 @@ class BackendCompiler:
         self.mapping = mapping
         # Endpoints that require shared auth imports/helpers
         self.auth_endpoints = ["l", "r", "u", "o", "m", "t", "a", "s", "k"]
+        self._auth_set = frozenset(self.auth_endpoints)
+        self._imports_auth = self.imports["auth_imports"]
+        # Snippets with their separator pre-appended, so compiling is lookup + join
+        self._mapping_joined = {k: v + "\n\n" for k, v in self.mapping.items()}
+        self._mapping_joined_bytes = {
+            k: v.encode("ascii") for k, v in self._mapping_joined.items()
+        }
+        self._imports_auth_bytes = self._imports_auth.encode("ascii")
 
         # Build index of (method, path) -> token for reverse lookup
         self._route_index = self._build_route_index()
+        # One alternation over every route decorator, so decompiling is a single scan
+        self._sig_to_token = {
+            f'@app.{method.lower()}("{path}")': token
+            for (method, path), token in self._route_index.items()
+        }
+        self._route_regex = re.compile(
+            "|".join(re.escape(sig) for sig in self._sig_to_token)
+        )
 
     def _build_route_index(self):
         index = {}
         for token, snippet in self.mapping.items():
-            # Find the decorator line like: @app.<method>("/path")
-            decorator_start = snippet.find("@app.")
-            if decorator_start == -1:
-                continue
-            line_end = snippet.find("\n", decorator_start)
-            line = snippet[decorator_start : line_end if line_end != -1 else None]
-            # Extract method and path by simple parsing
-            try:
-                after_app = line.split("@app.", 1)[1]
-                method = after_app.split("(", 1)[0].strip()
-                # find first quoted path
-                first_quote = line.find('"', line.find("(") + 1)
-                second_quote = line.find('"', first_quote + 1)
-                path = line[first_quote + 1 : second_quote]
-                index[(method.upper(), path)] = token
-            except Exception:
-                # Skip if format unexpected
-                continue
+            # Decorator line like: @app.<method>("/path")
+            match = _DECORATOR_RE.search(snippet)
+            if match:
+                index[(match.group(1).upper(), match.group(2))] = token
         return index
 
     def tokens_to_code(self, tokens, include_imports=True):
-        tokens = list(tokens)
-        parts = []
-        if include_imports and set(self.auth_endpoints) & set(tokens):
-            parts.append(self.imports["auth_imports"])
+        return self._assemble(
+            tokens, include_imports, self._mapping_joined, self._imports_auth, ""
+        )
+
+    def tokens_to_code_bytes(self, tokens, include_imports=True):
+        # Snippets are ASCII, so assembling bytes skips encoding the result
+        return self._assemble(
+            tokens,
+            include_imports,
+            self._mapping_joined_bytes,
+            self._imports_auth_bytes,
+            b"",
+        )
+
+    def _assemble(self, tokens, include_imports, mapping_joined, imports_auth, empty):
+        # Single pass; slot 0 is reserved for the auth imports so they still
+        # lead the output when the first auth token appears later in the list
+        parts = [empty]
+        append = parts.append
+        auth_set = self._auth_set
+        needs_auth = include_imports
         for token in tokens:
-            if token in self.mapping:
-                parts.append(self.mapping[token] + "\n\n")
-        return "".join(parts)
+            snippet = mapping_joined.get(token)
+            if snippet is None:
+                continue
+            if needs_auth and token in auth_set:
+                parts[0] = imports_auth
+                needs_auth = False
+            append(snippet)
+        return empty.join(parts)
 
     def file_tokens_to_code(self, input_path="input.txt", output_path="output.py"):
         with open(input_path, "r") as f:
@@ -220,14 +299,17 @@ class BackendCompiler:
         return code
 
     def code_to_tokens(self, code):
-        found = []  # list of (pos, token)
-        for (method, path), token in self._route_index.items():
-            signature = f'@app.{method.lower()}("{path}")'
-            pos = code.find(signature)
-            if pos != -1:
-                found.append((pos, token))
-        found.sort(key=lambda x: x[0])
-        return [t for _, t in found]
+        # Matches arrive in position order; keep each route's first occurrence
+        tokens = []
+        seen = set()
+        sig_to_token = self._sig_to_token
+        # findall builds the match strings in C, no Match object per hit
+        for sig in self._route_regex.findall(code):
+            token = sig_to_token[sig]
+            if token not in seen:
+                seen.add(token)
+                tokens.append(token)
+        return tokens
 
     def file_code_to_tokens(self, code_path="output.py"):
         with open(code_path, "r") as f:
@@ -235,7 +317,13 @@ class BackendCompiler:
         return self.code_to_tokens(code)
 
 
-app = FastAPI(default_response_class=ORJSONResponse)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_batch_pool()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 class CompileRequest(BaseModel):
@@ -247,6 +335,7 @@ class CompileRequest(BaseModel):
 
 MAX_FILE_BYTES = int(os.getenv("TRANSLATE_MAX_FILE_BYTES", "1048576"))
 BATCH_MAX_WORKERS = int(os.getenv("TRANSLATE_BATCH_MAX_WORKERS", "4"))
+BATCH_IO_CONCURRENCY = int(os.getenv("TRANSLATE_BATCH_IO_CONCURRENCY", "64"))
 CACHE_TTL_SECONDS = int(os.getenv("TRANSLATE_CACHE_TTL_SECONDS", "1800"))
 CACHE_MAXSIZE = int(os.getenv("TRANSLATE_CACHE_MAXSIZE", "256"))
 
@@ -262,33 +351,67 @@ def _compute_mapping_version() -> str:
 
 
 MAPPING_VERSION = _compute_mapping_version()
+MAPPING_KEYS_FS = frozenset(mapping.keys())
+# blake2b accepts keys of up to 64 bytes; the hex digest is exactly that long
+MAPPING_VERSION_BYTES = MAPPING_VERSION.encode("ascii")[:64]
+
+
+_batch_pool: Optional[cf.ThreadPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool() -> cf.ThreadPoolExecutor:
+    # One process-wide pool instead of a new executor per batch request
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = cf.ThreadPoolExecutor(
+                max_workers=BATCH_MAX_WORKERS, thread_name_prefix="translate-batch"
+            )
+        return _batch_pool
+
+
+def shutdown_batch_pool():
+    global _batch_pool
+    with _batch_pool_lock:
+        pool, _batch_pool = _batch_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+async def _run_batch(jobs, process, dedupe_key):
+    """Await process(idx, job) for every job concurrently.
+
+    Identical jobs (same dedupe_key) are only processed once; their result is
+    copied to the duplicates with the duplicate's own id.
+    """
+    groups = {}
+    for idx, job in enumerate(jobs):
+        groups.setdefault(dedupe_key(job), []).append(idx)
+
+    firsts = [indices[0] for indices in groups.values()]
+    done = await asyncio.gather(*(process(i, jobs[i]) for i in firsts))
+
+    results = [None] * len(jobs)
+    ok = 0
+    for indices, (_, success, payload) in zip(groups.values(), done):
+        for idx in indices:
+            if idx == indices[0]:
+                results[idx] = payload
+            else:
+                results[idx] = {**payload, "id": jobs[idx].id or str(idx)}
+            if success:
+                ok += 1
+    # Returning the response directly skips FastAPI's jsonable_encoder walk
+    return ORJSONResponse(
+        {"results": results, "totals": {"ok": ok, "failed": len(results) - ok}}
+    )
 
 
 def _read_text_with_limits(path: str, max_bytes: int = MAX_FILE_BYTES) -> str:
-    p = Path(path)
-    if not p.exists():
-        raise HTTPException(
-            status_code=404, detail={"code": "file_not_found", "path": str(path)}
-        )
+    # One open + fstat instead of exists/stat/read_text on the path
     try:
-        size = p.stat().st_size
-    except Exception as exc:
-        raise HTTPException(
-            status_code=400,
-            detail={"code": "file_stat_error", "path": str(path), "error": str(exc)},
-        )
-    if size > max_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail={
-                "code": "file_too_large",
-                "path": str(path),
-                "bytes": size,
-                "limit": max_bytes,
-            },
-        )
-    try:
-        return p.read_text(encoding="utf-8")
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
     except FileNotFoundError:
         raise HTTPException(
             status_code=404, detail={"code": "file_not_found", "path": str(path)}
@@ -298,6 +421,42 @@ def _read_text_with_limits(path: str, max_bytes: int = MAX_FILE_BYTES) -> str:
             status_code=400,
             detail={"code": "file_read_error", "path": str(path), "error": str(exc)},
         )
+    try:
+        try:
+            size = os.fstat(fd).st_size
+        except Exception as exc:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "file_stat_error", "path": str(path), "error": str(exc)},
+            )
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail={
+                    "code": "file_too_large",
+                    "path": str(path),
+                    "bytes": size,
+                    "limit": max_bytes,
+                },
+            )
+        try:
+            chunks = []
+            remaining = size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            return data.decode("utf-8")
+        except Exception as exc:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "file_read_error", "path": str(path), "error": str(exc)},
+            )
+    finally:
+        os.close(fd)
 
 
 def _ensure_output_parent_exists(path: str):
@@ -309,8 +468,13 @@ def _ensure_output_parent_exists(path: str):
         )
 
 
-def _validate_tokens(tokens: List[str], mapping_keys: List[str]):
-    if not isinstance(tokens, list) or any(not isinstance(t, str) for t in tokens):
+def _validate_tokens(
+    tokens: List[str], mapping_keys: AbstractSet[str], check_types: bool = True
+):
+    # Callers whose tokens came from a Pydantic List[str] skip the type scan
+    if check_types and (
+        not isinstance(tokens, list) or any(not isinstance(t, str) for t in tokens)
+    ):
         raise HTTPException(
             status_code=400,
             detail={
@@ -326,43 +490,76 @@ def _validate_tokens(tokens: List[str], mapping_keys: List[str]):
 
 
 class SimpleTTLCache:
+    """LRU cache whose entries also expire after `ttl` seconds."""
+
     def __init__(self, maxsize: int = CACHE_MAXSIZE, ttl: int = CACHE_TTL_SECONDS):
         self.maxsize = maxsize
         self.ttl = ttl
-        self._store = {}
+        self._store = OrderedDict()
         self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
     def get(self, key):
         with self._lock:
             item = self._store.get(key)
             if not item:
+                self._misses += 1
                 return None
             value, expiry = item
             if expiry < time():
                 self._store.pop(key, None)
+                self._misses += 1
                 return None
+            self._store.move_to_end(key)
+            self._hits += 1
             return value
 
     def set(self, key, value):
         with self._lock:
-            if len(self._store) >= self.maxsize:
-                # naive eviction: pop an arbitrary item
-                self._store.pop(next(iter(self._store)))
+            if key in self._store:
+                self._store.move_to_end(key)
+            elif len(self._store) >= self.maxsize:
+                # evict the least recently used entry
+                self._store.popitem(last=False)
             self._store[key] = (value, time() + self.ttl)
 
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    def record_hit(self):
+        """Count a hit served by a tier in front of this cache."""
+        with self._lock:
+            self._hits += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._store),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
 
 TOKENS_TO_CODE_CACHE = SimpleTTLCache()
 CODE_TO_TOKENS_CACHE = SimpleTTLCache()
 
 
+# Cache keys only index an in-process dict, so a fast keyed BLAKE2b is enough
 def _key_tokens(tokens: List[str], include_imports: bool) -> str:
-    raw = "|".join(tokens) + f"|imports={include_imports}|v={MAPPING_VERSION}"
-    return sha256(raw.encode("utf-8")).hexdigest()
+    raw = "|".join(tokens) + f"|i={int(include_imports)}"
+    return blake2b(
+        raw.encode("utf-8"), digest_size=16, key=MAPPING_VERSION_BYTES
+    ).hexdigest()
 
 
 def _key_code(code: str) -> str:
-    raw = sha256(code.encode("utf-8")).hexdigest() + f"|v={MAPPING_VERSION}"
-    return sha256(raw.encode("utf-8")).hexdigest()
+    return blake2b(
+        code.encode("utf-8"), digest_size=16, key=MAPPING_VERSION_BYTES
+    ).hexdigest()
 
 
 # Global compiler instance for reuse
@@ -376,23 +573,62 @@ def _get_compiler() -> "BackendCompiler":
     return GLOBAL_COMPILER
 
 
+class _MemoEntry:
+    """One memoised compile result, built only on a memo-tier miss."""
+
+    __slots__ = ("code", "key", "_first")
+
+    def __init__(self, code: bytes, key: str, ttl_hit: bool):
+        self.code = code
+        self.key = key
+        # Popped by the first caller to receive this entry; list.pop is atomic
+        self._first = [ttl_hit]
+
+    def claim_hit(self) -> bool:
+        """True if this lookup was a cache hit.
+
+        The caller whose call built the entry gets the TTL tier's outcome
+        (already counted there). Everyone after it was served by the memo
+        tier, so the hit is recorded on the TTL cache's counters as well.
+        """
+        try:
+            return self._first.pop()
+        except IndexError:
+            TOKENS_TO_CODE_CACHE.record_hit()
+            return True
+
+
+@lru_cache(maxsize=1024)
+def _tokens_to_code_memo(tokens_tuple: tuple, include_imports: bool) -> _MemoEntry:
+    # Lock-free front tier over the TTL cache; the body only runs on a miss
+    key = _key_tokens(tokens_tuple, include_imports)
+    code = TOKENS_TO_CODE_CACHE.get(key)
+    ttl_hit = code is not None
+    if code is None:
+        code = _get_compiler().tokens_to_code_bytes(
+            tokens_tuple, include_imports=include_imports
+        )
+        TOKENS_TO_CODE_CACHE.set(key, code)
+    return _MemoEntry(code, key, ttl_hit)
+
+
 def tokens_to_code_cached_info(
     tokens: List[str], include_imports: bool, use_cache: bool = True
 ):
-    key = _key_tokens(tokens, include_imports)
+    # Returns the code as ASCII bytes; callers decode only when they need str
     if use_cache:
-        cached = TOKENS_TO_CODE_CACHE.get(key)
-        if cached is not None:
-            return cached, True, key
+        entry = _tokens_to_code_memo(tuple(tokens), include_imports)
+        return entry.code, entry.claim_hit(), entry.key
+    key = _key_tokens(tokens, include_imports)
     compiler = _get_compiler()
-    code = compiler.tokens_to_code(tokens, include_imports=include_imports)
+    code = compiler.tokens_to_code_bytes(tokens, include_imports=include_imports)
     TOKENS_TO_CODE_CACHE.set(key, code)
     return code, False, key
 
 
 def tokens_to_code_cached(tokens: List[str], include_imports: bool) -> str:
     code, _, _ = tokens_to_code_cached_info(tokens, include_imports, use_cache=True)
-    return code
+    return code.decode("ascii")
 
 
 def code_to_tokens_cached_info(code: str, use_cache: bool = True):
@@ -412,14 +648,23 @@ def code_to_tokens_cached(code: str) -> List[str]:
     return tokens
 
 
-def _write_if_changed(path: str, content: str) -> bool:
+def _write_if_changed(path: str, content) -> bool:
+    # Accepts str or the bytes the compile caches hold
     p = Path(path)
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        if p.exists():
-            existing = p.read_text(encoding="utf-8")
-            if existing == content:
-                return False
-        p.write_text(content, encoding="utf-8")
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        try:
+            size = p.stat().st_size
+        except FileNotFoundError:
+            size = None
+        # Only a same-size file can be unchanged, so most writes skip the read
+        if size == len(data) and p.read_bytes() == data:
+            return False
+        # Write a sibling temp file and swap it in, so readers never see a
+        # partially written output
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
         return True
     except FileNotFoundError:
         raise HTTPException(
@@ -431,6 +676,14 @@ def _write_if_changed(path: str, content: str) -> bool:
             status_code=400,
             detail={"code": "file_write_error", "path": str(path), "error": str(exc)},
         )
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _write_batch_output(path: str, content: bytes) -> bool:
+    _ensure_output_parent_exists(path)
+    return _write_if_changed(path, content)
 
 
 class DecompileRequest(BaseModel):
@@ -443,7 +696,7 @@ def compile_api(body: CompileRequest):
     try:
         content = _read_text_with_limits(body.input_path)
         tokens = content.split()
-        _validate_tokens(tokens, list(mapping.keys()))
+        _validate_tokens(tokens, MAPPING_KEYS_FS)
         code, hit, cache_key = tokens_to_code_cached_info(
             tokens, include_imports=body.include_imports, use_cache=body.use_cache
         )
@@ -500,22 +753,34 @@ class BatchCompileRequest(BaseModel):
     jobs: List[BatchCompileJob]
 
 
-@app.post("/api/translate/to-s-batch")
-def compile_batch_api(body: BatchCompileRequest):
-    results = [None] * len(body.jobs)
-    ok = 0
+@app.post("/api/translate/to-s-batch", response_model=None)
+async def compile_batch_api(body: BatchCompileRequest):
+    # File IO runs on the default thread pool, bounded by the semaphore, while
+    # codegen runs on the batch pool, so reads and writes overlap with CPU work
+    io_slots = asyncio.Semaphore(BATCH_IO_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    pool = _get_batch_pool()
 
-    def process(idx: int, job: BatchCompileJob):
+    async def process(idx: int, job: BatchCompileJob):
         job_id = job.id or str(idx)
         try:
-            content = _read_text_with_limits(job.input_path)
+            async with io_slots:
+                content = await asyncio.to_thread(
+                    _read_text_with_limits, job.input_path
+                )
             tokens = content.split()
-            _validate_tokens(tokens, list(mapping.keys()))
-            code, hit, cache_key = tokens_to_code_cached_info(
-                tokens, include_imports=job.include_imports, use_cache=job.use_cache
+            _validate_tokens(tokens, MAPPING_KEYS_FS)
+            code, hit, cache_key = await loop.run_in_executor(
+                pool,
+                tokens_to_code_cached_info,
+                tokens,
+                job.include_imports,
+                job.use_cache,
             )
-            _ensure_output_parent_exists(job.output_path)
-            changed = _write_if_changed(job.output_path, code)
+            async with io_slots:
+                changed = await asyncio.to_thread(
+                    _write_batch_output, job.output_path, code
+                )
             res = {
                 "id": job_id,
                 "written_to": job.output_path,
@@ -546,15 +811,11 @@ def compile_batch_api(body: BatchCompileRequest):
                 },
             )
 
-    with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job) for i, job in enumerate(body.jobs)]
-        for fut in futures:
-            idx, success, payload = fut.result()
-            results[idx] = payload
-            if success:
-                ok += 1
-
-    return {"results": results, "totals": {"ok": ok, "failed": len(results) - ok}}
+    return await _run_batch(
+        body.jobs,
+        process,
+        lambda job: (job.input_path, job.output_path, job.include_imports, job.use_cache),
+    )
 
 
 class BatchDecompileJob(BaseModel):
@@ -567,17 +828,19 @@ class BatchDecompileRequest(BaseModel):
     jobs: List[BatchDecompileJob]
 
 
-@app.post("/api/translate/from-s-batch")
-def decompile_batch_api(body: BatchDecompileRequest):
-    results = [None] * len(body.jobs)
-    ok = 0
+@app.post("/api/translate/from-s-batch", response_model=None)
+async def decompile_batch_api(body: BatchDecompileRequest):
+    io_slots = asyncio.Semaphore(BATCH_IO_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    pool = _get_batch_pool()
 
-    def process(idx: int, job: BatchDecompileJob):
+    async def process(idx: int, job: BatchDecompileJob):
         job_id = job.id or str(idx)
         try:
-            code = _read_text_with_limits(job.code_path)
-            tokens, hit, cache_key = code_to_tokens_cached_info(
-                code, use_cache=job.use_cache
+            async with io_slots:
+                code = await asyncio.to_thread(_read_text_with_limits, job.code_path)
+            tokens, hit, cache_key = await loop.run_in_executor(
+                pool, code_to_tokens_cached_info, code, job.use_cache
             )
             if not tokens:
                 raise HTTPException(
@@ -617,39 +880,29 @@ def decompile_batch_api(body: BatchDecompileRequest):
                 },
             )
 
-    with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job) for i, job in enumerate(body.jobs)]
-        for fut in futures:
-            idx, success, payload = fut.result()
-            results[idx] = payload
-            if success:
-                ok += 1
-
-    return {"results": results, "totals": {"ok": ok, "failed": len(results) - ok}}
+    return await _run_batch(
+        body.jobs, process, lambda job: (job.code_path, job.use_cache)
+    )
 
 
 # Cache administration endpoints
-@app.get("/api/cache/stats")
+@app.get("/api/cache/stats", response_model=None)
 def cache_stats():
-    return {
-        "mapping_version": MAPPING_VERSION,
-        "tokens_to_code": {
-            "size": len(TOKENS_TO_CODE_CACHE._store),
-            "maxsize": TOKENS_TO_CODE_CACHE.maxsize,
-            "ttl_seconds": TOKENS_TO_CODE_CACHE.ttl,
-        },
-        "code_to_tokens": {
-            "size": len(CODE_TO_TOKENS_CACHE._store),
-            "maxsize": CODE_TO_TOKENS_CACHE.maxsize,
-            "ttl_seconds": CODE_TO_TOKENS_CACHE.ttl,
-        },
-    }
+    return ORJSONResponse(
+        {
+            "mapping_version": MAPPING_VERSION,
+            "tokens_to_code": TOKENS_TO_CODE_CACHE.stats(),
+            "tokens_to_code_memo": _tokens_to_code_memo.cache_info()._asdict(),
+            "code_to_tokens": CODE_TO_TOKENS_CACHE.stats(),
+        }
+    )
 
 
 @app.post("/api/cache/flush")
 def cache_flush():
-    TOKENS_TO_CODE_CACHE._store.clear()
-    CODE_TO_TOKENS_CACHE._store.clear()
+    _tokens_to_code_memo.cache_clear()
+    TOKENS_TO_CODE_CACHE.clear()
+    CODE_TO_TOKENS_CACHE.clear()
     return {"flushed": True}
 
 
@@ -663,12 +916,13 @@ class DirectCompileRequest(BaseModel):
 @app.post("/api/translate/to-s-direct")
 def compile_direct_api(body: DirectCompileRequest):
     try:
-        _validate_tokens(body.tokens, list(mapping.keys()))
+        _validate_tokens(body.tokens, MAPPING_KEYS_FS, check_types=False)
         code, hit, cache_key = tokens_to_code_cached_info(
             body.tokens, include_imports=body.include_imports, use_cache=body.use_cache
         )
         return {
-            "generated_code": code,
+            # Decoded only here, where the JSON body needs a str
+            "generated_code": code.decode("ascii"),
             "tokens": body.tokens,
             "bytes": len(code),
             "cache": {"hit": hit, "key": cache_key},
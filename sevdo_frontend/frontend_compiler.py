@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from typing import List, Optional, Tuple, Dict
 from pathlib import Path
 import os
+import sys
 import concurrent.futures as cf
 import tempfile
 
@@ -30,8 +31,13 @@ def load_prefabs():
     import importlib.util
     import sys
 
+    # Prefabs import shared helpers (e.g. _dsl) from their own directory
+    if str(prefabs_dir) not in sys.path:
+        sys.path.append(str(prefabs_dir))
+
     for file in prefabs_dir.glob("*.py"):
-        if file.name == "__init__.py":
+        # Skip the package marker and underscore-prefixed helper modules
+        if file.name.startswith("_"):
             continue
         try:
             # Import using file path instead of module name
@@ -121,7 +127,8 @@ def _parse_identifier(cur: _Cursor) -> str:
     start = cur.pos
     while not cur.eof() and cur.text[cur.pos].isalpha():
         cur.pos += 1
-    return cur.text[start : cur.pos]
+    # Interned so registry and prefab slot lookups match on identity
+    return sys.intern(cur.text[start : cur.pos])
 
 
 def _extract_balanced(cur: _Cursor, open_ch: str, close_ch: str) -> str:
@@ -152,11 +159,12 @@ def _parse_props_from_text(text: str) -> Dict[str, str]:
     for part in raw.split(","):
         if not part.strip():
             continue
+        # Keys are interned so prefab props.get("...") lookups match on identity
         if "=" in part:
             k, v = part.split("=", 1)
-            props[k.strip()] = v.strip()
+            props[sys.intern(k.strip())] = v.strip()
         else:
-            props[part.strip()] = "true"
+            props[sys.intern(part.strip())] = "true"
     return props
 
 
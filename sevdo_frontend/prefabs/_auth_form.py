@@ -0,0 +1,67 @@
+# sevdo_frontend/prefabs/_auth_form.py
+# Shared renderer for the login (lf) and register (rf) form prefabs.
+from _dsl import collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"b": "primary_text", "h": "title"}
+
+
+_FORM_TEMPLATE = """<form className="max-w-md mx-auto p-6">
+  <h1>{title}</h1>
+  <div className="flex flex-col gap-4">
+{fields}
+    <div className="flex flex-{direction} gap-2 mt-4">
+      <button className="{primary_class}">{primary_text}</button>
+      <button className="{secondary_class}">{secondary_text}</button>
+    </div>
+  </div>
+</form>"""
+
+_FIELD_TEMPLATE = """    <label className="block">
+      <span className="mb-1 block">{label}</span>
+      <input className="border rounded px-3 py-2 w-full"{attrs} />
+    </label>"""
+
+
+def render_auth_form(
+    args,
+    props,
+    *,
+    title,
+    fields,
+    primary_class,
+    secondary_class,
+    secondary_key,
+    direction,
+):
+    """Render an auth form.
+
+    ``props`` must already be merged with the prefab's defaults; ``fields`` is a
+    sequence of (label prop key, extra input attributes) pairs.
+    """
+    primary_text = props["buttonText"]
+
+    # Support for nested components
+    # If the args is a nested structure like "b(Custom Button Text)"
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        primary_text = found.get("primary_text", primary_text)
+        title = found.get("title", title)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+
+    field_jsx = "\n".join(
+        _FIELD_TEMPLATE.format(label=props[key], attrs=attrs) for key, attrs in fields
+    )
+    return _FORM_TEMPLATE.format(
+        title=title,
+        fields=field_jsx,
+        direction=direction,
+        primary_class=primary_class,
+        primary_text=primary_text,
+        secondary_class=secondary_class,
+        secondary_text=props[secondary_key],
+    )
@@ -0,0 +1,69 @@
+# sevdo_frontend/prefabs/_dsl.py
+# Shared helpers for prefabs: frontend compiler access and render memoization.
+import os
+import sys
+from functools import lru_cache, wraps
+
+# sevdo_frontend/, where frontend_compiler lives; resolved once at import
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@lru_cache(maxsize=1)
+def _frontend_compiler():
+    # Imported on first use rather than at module load to avoid circular imports
+    if _PARENT_DIR not in sys.path:
+        sys.path.append(_PARENT_DIR)
+    import frontend_compiler
+
+    return frontend_compiler
+
+
+@lru_cache(maxsize=2048)
+def cached_parse(source):
+    """parse_dsl memoized per source string; callers must not mutate the nodes."""
+    return tuple(_frontend_compiler().parse_dsl(source))
+
+
+@lru_cache(maxsize=2048)
+def parse_dsl_safe(source):
+    """cached_parse that returns None for malformed DSL instead of raising."""
+    try:
+        return cached_parse(source)
+    except Exception:
+        return None
+
+
+_NO_PROPS = frozenset()
+
+
+def cached_prefab(render):
+    """Memoize a pure render_prefab(args, props) on (args, frozenset(props))."""
+
+    @lru_cache(maxsize=4096)
+    def _cached(args, frozen_props):
+        return render(args, dict(frozen_props))
+
+    @wraps(render)
+    def wrapper(args, props):
+        if not props:
+            # Default-props renders are the common case; skip building a key
+            return _cached(args, _NO_PROPS)
+        try:
+            key = frozenset(props.items())
+        except TypeError:
+            # Unhashable prop values cannot be cached
+            return render(args, props)
+        return _cached(args, key)
+
+    wrapper.cache_clear = _cached.cache_clear
+    return wrapper
+
+
+def collect_args(nodes, slots):
+    """Return {slot: args} for nodes whose token is in slots; later nodes win."""
+    found = {}
+    for node in nodes:
+        slot = slots.get(node.token)
+        if slot is not None and node.args:
+            found[slot] = node.args
+    return found
@@ -1,54 +1,53 @@
 # sevdo_frontend/prefabs/button_component.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
+# Nested DSL token -> field it overrides
+_SLOTS = {"b": "text", "t": "text", "h": "text"}
+
+# Size-based classes
+_SIZE_CLASSES = {
+    "sm": "px-3 py-1.5 text-sm",
+    "md": "px-4 py-2 text-sm",
+    "lg": "px-5 py-3 text-base",
+}
+
+_PALETTE = {
+    "primary": "bg-blue-600 hover:bg-blue-700 text-white",
+    "secondary": "bg-gray-500 hover:bg-gray-600 text-white",
+    "danger": "bg-red-600 hover:bg-red-700 text-white",
+}
+
+_DEFAULTS = {
+    "size": "md",
+    "variant": "primary",
+    "class": "",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
+    props = _DEFAULTS | props
     text = props.get("text", props.get("label", "Click"))
     href = props.get("href")
     on_click = props.get("onClick")
-    size = props.get("size", "md")  # sm | md | lg
-    variant = props.get("variant", "primary")  # primary | secondary | danger
-    extra_class = props.get("class", "")
+    size = props["size"]  # sm | md | lg
+    variant = props["variant"]  # primary | secondary | danger
+    extra_class = props["class"]
 
     # Support for nested components
     # If the args is a nested structure like "t(Custom Text)" or "b(Custom Text)"
     # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(
-            os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Prefer explicit text from tokens
-                    if node.token in ("b", "t", "h") and node.args:
-                        text = node.args
-        except Exception:
-            # If parsing fails, just use args as the text
-            text = args
-
-    # Size-based classes
-    if size == "sm":
-        size_classes = "px-3 py-1.5 text-sm"
-    elif size == "lg":
-        size_classes = "px-5 py-3 text-base"
-    else:
-        size_classes = "px-4 py-2 text-sm"
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        text = found.get("text", text)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        text = args
 
-    if variant == "secondary":
-        palette = "bg-gray-500 hover:bg-gray-600 text-white"
-    elif variant == "danger":
-        palette = "bg-red-600 hover:bg-red-700 text-white"
-    else:
-        palette = "bg-blue-600 hover:bg-blue-700 text-white"
+    size_classes = _SIZE_CLASSES.get(size, _SIZE_CLASSES["md"])
+    palette = _PALETTE.get(variant, _PALETTE["primary"])
 
     base_classes = f"{palette} font-medium rounded"
     class_name = f"{base_classes} {size_classes}"
@@ -1,48 +1,60 @@
 # sevdo_frontend/prefabs/card_component.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {
+    "b": "button_text",
+    "h": "title",
+    "t": "content",
+    "i": "image_url",
+    "ft": "footer_text",
+}
+
+
+_TEMPLATE = """<div className="max-w-sm mx-auto bg-white border border-gray-200 rounded-lg shadow-md overflow-hidden">
+  {image_section}
+  <div className="p-6">
+    <h2 className="text-xl font-bold text-gray-800 mb-3">{title}</h2>
+    <p className="text-gray-600 mb-4 leading-relaxed">{content}</p>
+    <button className="bg-blue-600 hover:bg-blue-700 text-white font-medium px-4 py-2 rounded-lg transition-colors duration-200">
+      {button_text}
+    </button>
+  </div>{footer_section}
+</div>"""
+
+
+_DEFAULTS = {
+    "content": "This is a card with some content.",
+    "buttonText": "Learn More",
+    "imageUrl": "",
+    "footerText": "",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
+    props = _DEFAULTS | props
     title = "Card Title"
-    content = props.get("content", "This is a card with some content.")
-    button_text = props.get("buttonText", "Learn More")
-    image_url = props.get("imageUrl", "")
-    footer_text = props.get("footerText", "")
+    content = props["content"]
+    button_text = props["buttonText"]
+    image_url = props["imageUrl"]
+    footer_text = props["footerText"]
     
     # Support for nested components 
     # If the args is a nested structure like "b(Custom Button Text)" 
     # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Replace button text if b() token is found
-                    if node.token == "b" and node.args:
-                        button_text = node.args
-                    # Replace title if h() token is found  
-                    elif node.token == "h" and node.args:
-                        title = node.args
-                    # Replace content if t() token is found (text)
-                    elif node.token == "t" and node.args:
-                        content = node.args
-                    # Replace image if i() token is found
-                    elif node.token == "i" and node.args:
-                        image_url = node.args
-                    # Replace footer if ft() token is found
-                    elif node.token == "ft" and node.args:
-                        footer_text = node.args
-        except Exception:
-            # If parsing fails, just use args as the title
-            title = args
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        button_text = found.get("button_text", button_text)
+        title = found.get("title", title)
+        content = found.get("content", content)
+        image_url = found.get("image_url", image_url)
+        footer_text = found.get("footer_text", footer_text)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
     
     # Generate image section if URL provided
     image_section = ""
@@ -58,16 +70,13 @@ def render_prefab(args, props):
     </div>'''
             
     # Generate card with customized parts
-    return f"""<div className="max-w-sm mx-auto bg-white border border-gray-200 rounded-lg shadow-md overflow-hidden">
-  {image_section}
-  <div className="p-6">
-    <h2 className="text-xl font-bold text-gray-800 mb-3">{title}</h2>
-    <p className="text-gray-600 mb-4 leading-relaxed">{content}</p>
-    <button className="bg-blue-600 hover:bg-blue-700 text-white font-medium px-4 py-2 rounded-lg transition-colors duration-200">
-      {button_text}
-    </button>
-  </div>{footer_section}
-</div>"""
+    return _TEMPLATE.format(
+        image_section=image_section,
+        title=title,
+        content=content,
+        button_text=button_text,
+        footer_section=footer_section,
+    )
 
 # Register with token "cd"
 COMPONENT_TOKEN = "cd"
@@ -1,44 +1,11 @@
 # sevdo_frontend/prefabs/chat_component.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Chat")
-    placeholder = props.get("placeholder", "Type your message...")
-    send_text = props.get("sendText", "Send")
-    chat_height = props.get("height", "400px")
-    
-    # Support for nested components 
-    # If the args is a nested structure like "b(Custom Button Text)" 
-    # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Replace send button text if b() token is found
-                    if node.token == "b" and node.args:
-                        send_text = node.args
-                    # Replace title if h() token is found  
-                    elif node.token == "h" and node.args:
-                        title = node.args
-                    # Replace placeholder if p() token is found
-                    elif node.token == "p" and node.args:
-                        placeholder = node.args
-        except Exception:
-            # If parsing fails, just use args as the title
-            title = args
-            
-    # Generate chat component with customized parts
-    return f"""<div className="max-w-2xl mx-auto p-4 border rounded-lg">
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"b": "send_text", "h": "title", "p": "placeholder"}
+
+
+_TEMPLATE = """<div className="max-w-2xl mx-auto p-4 border rounded-lg">
   <h2 className="text-xl font-bold mb-4">{title}</h2>
   <div className="chat-container" style={{{{height: '{chat_height}'}}}}>
     <div className="chat-messages bg-gray-50 p-4 rounded-lg mb-4 overflow-y-auto" style={{{{height: 'calc({chat_height} - 100px)'}}}}>
@@ -66,5 +33,44 @@ def render_prefab(args, props):
   </div>
 </div>"""
 
+
+_DEFAULTS = {
+    "title": "Chat",
+    "placeholder": "Type your message...",
+    "sendText": "Send",
+    "height": "400px",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    placeholder = props["placeholder"]
+    send_text = props["sendText"]
+    chat_height = props["height"]
+    
+    # Support for nested components 
+    # If the args is a nested structure like "b(Custom Button Text)" 
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        send_text = found.get("send_text", send_text)
+        title = found.get("title", title)
+        placeholder = found.get("placeholder", placeholder)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+            
+    # Generate chat component with customized parts
+    return _TEMPLATE.format(
+        title=title,
+        chat_height=chat_height,
+        placeholder=placeholder,
+        send_text=send_text,
+    )
+
 # Register with token "ch"
 COMPONENT_TOKEN = "ch"
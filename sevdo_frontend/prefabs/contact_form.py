@@ -1,41 +1,11 @@
 # sevdo_frontend/prefabs/contact_form.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Get in Touch")
-    subtitle = props.get(
-        "subtitle",
-        "We'd love to hear from you. Send us a message and we'll respond as soon as possible.",
-    )
-    name_label = props.get("nameLabel", "Full Name")
-    email_label = props.get("emailLabel", "Email Address")
-    subject_label = props.get("subjectLabel", "Subject")
-    message_label = props.get("messageLabel", "Message")
-    button_text = props.get("buttonText", "Send Message")
-
-    # Support for nested components
-    if args:
-        import sys
-        import os
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle", "b": "button_text"}
 
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-                    elif node.token == "b" and node.args:
-                        button_text = node.args
-        except Exception:
-            title = args if args else title
 
-    return f"""<section className="py-12 bg-gray-50">
+_TEMPLATE = """<section className="py-12 bg-gray-50">
   <div className="max-w-2xl mx-auto px-4">
     <div className="text-center mb-8">
       <h2 className="text-3xl font-bold text-gray-900 mb-4">{title}</h2>
@@ -95,5 +65,50 @@ def render_prefab(args, props):
 </section>"""
 
 
+_DEFAULTS = {
+    "title": "Get in Touch",
+    "subtitle": "We'd love to hear from you. Send us a message and we'll respond as soon as possible.",
+    "nameLabel": "Full Name",
+    "emailLabel": "Email Address",
+    "subjectLabel": "Subject",
+    "messageLabel": "Message",
+    "buttonText": "Send Message",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    subtitle = props["subtitle"]
+    name_label = props["nameLabel"]
+    email_label = props["emailLabel"]
+    subject_label = props["subjectLabel"]
+    message_label = props["messageLabel"]
+    button_text = props["buttonText"]
+
+    # Support for nested components
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+        button_text = found.get("button_text", button_text)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+
+    return _TEMPLATE.format(
+        title=title,
+        subtitle=subtitle,
+        name_label=name_label,
+        email_label=email_label,
+        subject_label=subject_label,
+        message_label=message_label,
+        button_text=button_text,
+    )
+
+
 # Register with token "cf"
 COMPONENT_TOKEN = "cf"
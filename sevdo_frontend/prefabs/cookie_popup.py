@@ -1,46 +1,11 @@
 # sevdo_frontend/prefabs/cookie_popup.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "We use cookies")
-    message = props.get(
-        "message",
-        "We use cookies to enhance your experience. By continuing to visit this site you agree to our use of cookies.",
-    )
-    accept_text = props.get("acceptText", "Accept All")
-    reject_text = props.get("rejectText", "Reject")
-    settings_text = props.get("settingsText", "Cookie Settings")
-    position = props.get("position", "bottom")  # bottom, top
-    style = props.get("style", "banner")  # banner, modal
-
-    # Support for nested components
-    if args:
-        import sys
-        import os
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "message", "b": "accept_text"}
 
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        message = node.args
-                    elif node.token == "b" and node.args:
-                        accept_text = node.args
-        except Exception:
-            title = args if args else title
 
-    # Position classes
-    position_class = "bottom-0" if position == "bottom" else "top-0"
-
-    # Style variants
-    if style == "modal":
-        return f"""<div id="cookie-popup" className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
+_MODAL_TEMPLATE = """<div id="cookie-popup" className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
   <div className="bg-white rounded-lg p-6 m-4 max-w-md w-full shadow-xl">
     <h3 className="text-lg font-semibold text-gray-900 mb-3">{title}</h3>
     <p className="text-gray-600 mb-6 text-sm">{message}</p>
@@ -67,8 +32,7 @@ def render_prefab(args, props):
   </div>
 </div>"""
 
-    # Banner style (default)
-    return f"""<div id="cookie-popup" className="fixed {position_class} left-0 right-0 bg-gray-900 text-white p-4 shadow-lg z-50">
+_BANNER_TEMPLATE = """<div id="cookie-popup" className="fixed {position_class} left-0 right-0 bg-gray-900 text-white p-4 shadow-lg z-50">
   <div className="max-w-7xl mx-auto flex flex-col sm:flex-row items-start sm:items-center justify-between gap-4">
     <div className="flex-1">
       <h3 className="font-semibold mb-1">{title}</h3>
@@ -98,5 +62,56 @@ def render_prefab(args, props):
 </div>"""
 
 
+_TEMPLATES = {"modal": _MODAL_TEMPLATE, "banner": _BANNER_TEMPLATE}
+
+_POSITION = {"bottom": "bottom-0", "top": "top-0"}
+
+
+_DEFAULTS = {
+    "title": "We use cookies",
+    "message": "We use cookies to enhance your experience. By continuing to visit this site you agree to our use of cookies.",
+    "acceptText": "Accept All",
+    "rejectText": "Reject",
+    "settingsText": "Cookie Settings",
+    "position": "bottom",
+    "style": "banner",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    message = props["message"]
+    accept_text = props["acceptText"]
+    reject_text = props["rejectText"]
+    settings_text = props["settingsText"]
+    position = props["position"]  # bottom, top
+    style = props["style"]  # banner, modal
+
+    # Support for nested components
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        message = found.get("message", message)
+        accept_text = found.get("accept_text", accept_text)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+
+    # Unknown styles fall back to the banner, unknown positions to the top
+    template = _TEMPLATES.get(style, _BANNER_TEMPLATE)
+    return template.format(
+        position_class=_POSITION.get(position, "top-0"),
+        title=title,
+        message=message,
+        accept_text=accept_text,
+        reject_text=reject_text,
+        settings_text=settings_text,
+    )
+
+
 # Register with token "co"
 COMPONENT_TOKEN = "co"
@@ -1,74 +1,11 @@
 # sevdo_frontend/prefabs/cta_section.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Ready to Transform Your Business?")
-    subtitle = props.get(
-        "subtitle", "Join 10,000+ companies already using our platform"
-    )
-    description = props.get(
-        "description",
-        "Start your free trial today. No credit card required. Cancel anytime.",
-    )
-    primary_button = props.get("primaryButton", "Start Free Trial")
-    secondary_button = props.get("secondaryButton", "Book a Demo")
-    style = props.get("style", "centered")  # centered, split, gradient, minimal
-    urgency = props.get("urgency", "true")  # Show urgency elements
-    testimonial = props.get(
-        "testimonial", "This platform increased our productivity by 300%"
-    )
-    testimonial_author = props.get("testimonialAuthor", "Sarah Chen, CEO at TechCorp")
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
-    # Support for nested components
-    if args:
-        import sys
-        import os
-
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
-
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-                    elif node.token == "b" and node.args:
-                        primary_button = node.args
-        except Exception:
-            title = args if args else title
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle", "b": "primary_button"}
 
-    # Urgency elements
-    urgency_html = ""
-    if urgency == "true":
-        urgency_html = """
-        <div className="flex items-center justify-center space-x-6 mb-8 text-sm">
-            <div className="flex items-center text-green-600">
-                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
-                </svg>
-                14-day free trial
-            </div>
-            <div className="flex items-center text-green-600">
-                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
-                </svg>
-                No credit card required
-            </div>
-            <div className="flex items-center text-green-600">
-                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
-                </svg>
-                Cancel anytime
-            </div>
-        </div>"""
 
-    # Style-specific layouts
-    if style == "gradient":
-        return f'''<section className="relative py-20 bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800 text-white overflow-hidden">
+_GRADIENT_TEMPLATE = '''<section className="relative py-20 bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800 text-white overflow-hidden">
   <div className="absolute inset-0 bg-black opacity-20"></div>
   <div className="absolute inset-0">
     <div className="absolute top-10 left-10 w-72 h-72 bg-white opacity-10 rounded-full blur-3xl"></div>
@@ -94,8 +31,7 @@ def render_prefab(args, props):
   </div>
 </section>'''
 
-    elif style == "split":
-        return f'''<section className="py-20 bg-gray-50">
+_SPLIT_TEMPLATE = '''<section className="py-20 bg-gray-50">
   <div className="max-w-7xl mx-auto px-4">
     <div className="grid lg:grid-cols-2 gap-12 items-center">
       <div>
@@ -146,8 +82,7 @@ def render_prefab(args, props):
   </div>
 </section>'''
 
-    elif style == "minimal":
-        return f"""<section className="py-16 bg-white border-t border-b border-gray-200">
+_MINIMAL_TEMPLATE = """<section className="py-16 bg-white border-t border-b border-gray-200">
   <div className="max-w-4xl mx-auto px-4 text-center">
     <h2 className="text-3xl font-bold text-gray-900 mb-4">{title}</h2>
     <p className="text-lg text-gray-600 mb-8 max-w-2xl mx-auto">{description}</p>
@@ -162,8 +97,7 @@ def render_prefab(args, props):
   </div>
 </section>"""
 
-    else:  # centered (default)
-        return f'''<section className="py-20 bg-blue-50">
+_CENTERED_TEMPLATE = '''<section className="py-20 bg-blue-50">
   <div className="max-w-4xl mx-auto px-4 text-center">
     <h2 className="text-4xl md:text-5xl font-bold text-gray-900 mb-6">{title}</h2>
     <p className="text-xl text-gray-600 mb-4">{subtitle}</p>
@@ -206,5 +140,114 @@ def render_prefab(args, props):
 </section>'''
 
 
+_DEFAULTS = {
+    "title": "Ready to Transform Your Business?",
+    "subtitle": "Join 10,000+ companies already using our platform",
+    "description": "Start your free trial today. No credit card required. Cancel anytime.",
+    "primaryButton": "Start Free Trial",
+    "secondaryButton": "Book a Demo",
+    "style": "centered",
+    "urgency": "true",
+    "testimonial": "This platform increased our productivity by 300%",
+    "testimonialAuthor": "Sarah Chen, CEO at TechCorp",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    subtitle = props["subtitle"]
+    description = props["description"]
+    primary_button = props["primaryButton"]
+    secondary_button = props["secondaryButton"]
+    style = props["style"]  # centered, split, gradient, minimal
+    urgency = props["urgency"]  # Show urgency elements
+    testimonial = props["testimonial"]
+    testimonial_author = props["testimonialAuthor"]
+
+    # Support for nested components
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+        primary_button = found.get("primary_button", primary_button)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+
+    # Urgency elements
+    urgency_html = ""
+    if urgency == "true":
+        urgency_html = """
+        <div className="flex items-center justify-center space-x-6 mb-8 text-sm">
+            <div className="flex items-center text-green-600">
+                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
+                </svg>
+                14-day free trial
+            </div>
+            <div className="flex items-center text-green-600">
+                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
+                </svg>
+                No credit card required
+            </div>
+            <div className="flex items-center text-green-600">
+                <svg className="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
+                </svg>
+                Cancel anytime
+            </div>
+        </div>"""
+
+    # Style-specific layouts
+    if style == "gradient":
+        return _GRADIENT_TEMPLATE.format(
+            title=title,
+            subtitle=subtitle,
+            description=description,
+            urgency_html=urgency_html,
+            primary_button=primary_button,
+            secondary_button=secondary_button,
+            testimonial=testimonial,
+            testimonial_author=testimonial_author,
+        )
+
+    elif style == "split":
+        return _SPLIT_TEMPLATE.format(
+            title=title,
+            subtitle=subtitle,
+            description=description,
+            urgency_html=urgency_html,
+            primary_button=primary_button,
+            secondary_button=secondary_button,
+            testimonial=testimonial,
+            testimonial_author=testimonial_author,
+        )
+
+    elif style == "minimal":
+        return _MINIMAL_TEMPLATE.format(
+            title=title,
+            description=description,
+            primary_button=primary_button,
+            secondary_button=secondary_button,
+        )
+
+    else:  # centered (default)
+        return _CENTERED_TEMPLATE.format(
+            title=title,
+            subtitle=subtitle,
+            description=description,
+            urgency_html=urgency_html,
+            primary_button=primary_button,
+            secondary_button=secondary_button,
+            testimonial=testimonial,
+            testimonial_author=testimonial_author,
+        )
+
+
 # Register with token "cta"
 COMPONENT_TOKEN = "cta"
@@ -1,46 +1,11 @@
 # sevdo_frontend/prefabs/email_component.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Compose Email")
-    to_label = props.get("toLabel", "To")
-    subject_label = props.get("subjectLabel", "Subject")
-    message_label = props.get("messageLabel", "Message")
-    send_text = props.get("sendText", "Send Email")
-    draft_text = props.get("draftText", "Save Draft")
-    
-    # Support for nested components 
-    # If the args is a nested structure like "b(Custom Button Text)" 
-    # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Replace send button text if b() token is found
-                    if node.token == "b" and node.args:
-                        send_text = node.args
-                    # Replace title if h() token is found  
-                    elif node.token == "h" and node.args:
-                        title = node.args
-                    # Replace subject if s() token is found
-                    elif node.token == "s" and node.args:
-                        subject_label = node.args
-        except Exception:
-            # If parsing fails, just use args as the title
-            title = args
-            
-    # Generate email composer with customized parts
-    return f"""<div className="max-w-2xl mx-auto p-6 border rounded-lg bg-white">
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"b": "send_text", "h": "title", "s": "subject_label"}
+
+
+_TEMPLATE = """<div className="max-w-2xl mx-auto p-6 border rounded-lg bg-white">
   <h2 className="text-2xl font-bold mb-6">{title}</h2>
   <form className="space-y-4">
     <div>
@@ -83,5 +48,50 @@ def render_prefab(args, props):
   </form>
 </div>"""
 
+
+_DEFAULTS = {
+    "title": "Compose Email",
+    "toLabel": "To",
+    "subjectLabel": "Subject",
+    "messageLabel": "Message",
+    "sendText": "Send Email",
+    "draftText": "Save Draft",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    to_label = props["toLabel"]
+    subject_label = props["subjectLabel"]
+    message_label = props["messageLabel"]
+    send_text = props["sendText"]
+    draft_text = props["draftText"]
+    
+    # Support for nested components 
+    # If the args is a nested structure like "b(Custom Button Text)" 
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        send_text = found.get("send_text", send_text)
+        title = found.get("title", title)
+        subject_label = found.get("subject_label", subject_label)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+            
+    # Generate email composer with customized parts
+    return _TEMPLATE.format(
+        title=title,
+        to_label=to_label,
+        subject_label=subject_label,
+        message_label=message_label,
+        send_text=send_text,
+        draft_text=draft_text,
+    )
+
 # Register with token "em"
 COMPONENT_TOKEN = "em"
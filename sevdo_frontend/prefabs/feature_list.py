@@ -1,12 +1,26 @@
 # sevdo_frontend/prefabs/feature_list.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle"}
+
+
+_DEFAULTS = {
+    "title": "Why Choose Our Platform",
+    "subtitle": "Everything you need to succeed, built for modern teams",
+    "style": "cards",
+    "layout": "grid",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
-    title = props.get("title", "Why Choose Our Platform")
-    subtitle = props.get(
-        "subtitle", "Everything you need to succeed, built for modern teams"
-    )
-    style = props.get("style", "cards")  # cards, minimal, animated
-    layout = props.get("layout", "grid")  # grid, list, masonry
+    props = _DEFAULTS | props
+    title = props["title"]
+    subtitle = props["subtitle"]
+    style = props["style"]  # cards, minimal, animated
+    layout = props["layout"]  # grid, list, masonry
 
     # Default features with modern SaaS benefits
     default_features = [
@@ -49,25 +63,14 @@ def render_prefab(args, props):
     ]
 
     # Support for nested components
-    if args:
-        import sys
-        import os
-
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
-
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-        except Exception:
-            title = args if args else title
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
 
     # Generate feature cards based on style
     if style == "minimal":
@@ -1,81 +1,18 @@
 # sevdo_frontend/prefabs/footer_component.py
-def render_prefab(args, props):
-    # Default values
-    company_name = props.get("companyName", "My Company")
-    copyright_year = props.get("copyrightYear", "2024")
-    tagline = props.get("tagline", "Building amazing products")
-    links = props.get("links", ["Privacy", "Terms", "Support", "About"])
-    social_media = props.get("socialMedia", ["Facebook", "Twitter", "LinkedIn"])
-    background_style = props.get("backgroundStyle", "dark")  # dark or light
-    
-    # Support for nested components 
-    # If the args is a nested structure like "h(Company Name)" 
-    # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Replace company name if h() token is found  
-                    if node.token == "h" and node.args:
-                        company_name = node.args
-                    # Replace tagline if t() token is found
-                    elif node.token == "t" and node.args:
-                        tagline = node.args
-                    # Replace year if y() token is found
-                    elif node.token == "y" and node.args:
-                        copyright_year = node.args
-                    # Replace links if l() token is found (comma-separated)
-                    elif node.token == "l" and node.args:
-                        links = [link.strip() for link in node.args.split(",")]
-                    # Replace social media if s() token is found (comma-separated)
-                    elif node.token == "s" and node.args:
-                        social_media = [social.strip() for social in node.args.split(",")]
-                    # Replace background style if bg() token is found
-                    elif node.token == "bg" and node.args:
-                        background_style = node.args
-        except Exception:
-            # If parsing fails, just use args as the company name
-            company_name = args
-    
-    # Generate link items
-    link_items = "\n".join([
-        f'        <a href="#" className="hover:text-blue-400 transition-colors duration-200">{link}</a>'
-        for link in links
-    ])
-    
-    # Generate social media items
-    social_items = "\n".join([
-        f'        <a href="#" className="hover:text-blue-400 transition-colors duration-200">{social}</a>'
-        for social in social_media
-    ])
-    
-    # Determine styling based on background
-    if background_style == "light":
-        bg_class = "bg-gray-100"
-        text_class = "text-gray-800"
-        secondary_text_class = "text-gray-600"
-        hover_class = "hover:text-blue-600"
-        border_class = "border-gray-200"
-    else:
-        bg_class = "bg-gray-800"
-        text_class = "text-white"
-        secondary_text_class = "text-gray-300"
-        hover_class = "hover:text-blue-400"
-        border_class = "border-gray-700"
-    
-    # Generate footer with customized parts
-    return f"""<footer className="{bg_class} {text_class} py-12 mt-auto">
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {
+    "h": "company_name",
+    "t": "tagline",
+    "y": "copyright_year",
+    "l": "links",
+    "s": "social_media",
+    "bg": "background_style",
+}
+
+
+_TEMPLATE = """<footer className="{bg_class} {text_class} py-12 mt-auto">
   <div className="max-w-6xl mx-auto px-4">
     <div className="grid md:grid-cols-4 gap-8">
       <!-- Company Info -->
@@ -118,5 +55,85 @@ def render_prefab(args, props):
   </div>
 </footer>"""
 
+
+_DEFAULTS = {
+    "companyName": "My Company",
+    "copyrightYear": "2024",
+    "tagline": "Building amazing products",
+    "backgroundStyle": "dark",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    company_name = props["companyName"]
+    copyright_year = props["copyrightYear"]
+    tagline = props["tagline"]
+    links = props.get("links", ["Privacy", "Terms", "Support", "About"])
+    social_media = props.get("socialMedia", ["Facebook", "Twitter", "LinkedIn"])
+    background_style = props["backgroundStyle"]  # dark or light
+    
+    # Support for nested components 
+    # If the args is a nested structure like "h(Company Name)" 
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        company_name = found.get("company_name", company_name)
+        tagline = found.get("tagline", tagline)
+        copyright_year = found.get("copyright_year", copyright_year)
+        if "links" in found:
+            links = [link.strip() for link in found["links"].split(",")]
+        if "social_media" in found:
+            social_media = [
+                social.strip() for social in found["social_media"].split(",")
+            ]
+        background_style = found.get("background_style", background_style)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        company_name = args
+    
+    # Generate link items
+    link_items = "\n".join([
+        f'        <a href="#" className="hover:text-blue-400 transition-colors duration-200">{link}</a>'
+        for link in links
+    ])
+    
+    # Generate social media items
+    social_items = "\n".join([
+        f'        <a href="#" className="hover:text-blue-400 transition-colors duration-200">{social}</a>'
+        for social in social_media
+    ])
+    
+    # Determine styling based on background
+    if background_style == "light":
+        bg_class = "bg-gray-100"
+        text_class = "text-gray-800"
+        secondary_text_class = "text-gray-600"
+        hover_class = "hover:text-blue-600"
+        border_class = "border-gray-200"
+    else:
+        bg_class = "bg-gray-800"
+        text_class = "text-white"
+        secondary_text_class = "text-gray-300"
+        hover_class = "hover:text-blue-400"
+        border_class = "border-gray-700"
+    
+    # Generate footer with customized parts
+    return _TEMPLATE.format(
+        bg_class=bg_class,
+        text_class=text_class,
+        company_name=company_name,
+        secondary_text_class=secondary_text_class,
+        tagline=tagline,
+        link_items=link_items,
+        social_items=social_items,
+        border_class=border_class,
+        copyright_year=copyright_year,
+        hover_class=hover_class,
+    )
+
 # Register with token "ft"
 COMPONENT_TOKEN = "ft"
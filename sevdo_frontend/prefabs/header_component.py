@@ -1,39 +1,43 @@
 # sevdo_frontend/prefabs/header_component.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle"}
+
+
+_DEFAULTS = {
+    "subtitle": "",
+    "variant": "primary",
+    "align": "left",
+    "class": "",
+    "subtitleClass": "",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
+    props = _DEFAULTS | props
     title = props.get("text", props.get("title", "Header"))
-    subtitle = props.get("subtitle", "")
+    subtitle = props["subtitle"]
     level = str(props.get("level", "h1")).lower()  # h1..h6
-    variant = props.get("variant", "primary")  # primary | secondary | danger
-    align = props.get("align", "left")  # left | center | right
+    variant = props["variant"]  # primary | secondary | danger
+    align = props["align"]  # left | center | right
     href = props.get("href")
-    extra_class = props.get("class", "")
-    subtitle_class_extra = props.get("subtitleClass", "")
+    extra_class = props["class"]
+    subtitle_class_extra = props["subtitleClass"]
 
     # Support for nested components
     # If args contains nested DSL like "h(Custom Title) t(Subtitle text)",
     # prefer those values for title/subtitle
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        parent_dir = os.path.dirname(
-            os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-        except Exception:
-            # If parsing fails, use raw args as title
-            title = args
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
 
     # Normalize/validate heading level
     valid_levels = {"h1", "h2", "h3", "h4", "h5", "h6"}
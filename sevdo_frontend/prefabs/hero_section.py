@@ -1,51 +1,11 @@
 # sevdo_frontend/prefabs/hero_section.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Transform Your Business Today")
-    subtitle = props.get("subtitle", "Powerful Solutions for Modern Challenges")
-    description = props.get(
-        "description",
-        "Join thousands of companies who trust our platform to grow their business. Get started with our comprehensive suite of tools designed for success.",
-    )
-    primary_button = props.get("primaryButton", "Get Started Free")
-    secondary_button = props.get("secondaryButton", "Learn More")
-    background = props.get("background", "gradient")  # gradient, image, solid
-
-    # Support for nested components
-    if args:
-        import sys
-        import os
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle", "b": "primary_button"}
 
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-                    elif node.token == "b" and node.args:
-                        primary_button = node.args
-        except Exception:
-            title = args if args else title
 
-    # Background styling based on background prop
-    if background == "gradient":
-        bg_class = "bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800"
-    elif background == "solid":
-        bg_class = "bg-blue-600"
-    elif background == "image":
-        bg_class = "bg-gray-900 bg-cover bg-center"
-        # Note: In real implementation, you'd add background-image via props
-    else:
-        bg_class = "bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800"
-
-    return f"""<section className="relative {bg_class} text-white min-h-screen flex items-center">
+_TEMPLATE = """<section className="relative {bg_class} text-white min-h-screen flex items-center">
   <div className="absolute inset-0 bg-black opacity-20"></div>
   <div className="relative z-10 max-w-6xl mx-auto px-4 py-20 text-center">
     <h1 className="text-5xl md:text-7xl font-bold mb-6 leading-tight">
@@ -77,5 +37,58 @@ def render_prefab(args, props):
 </section>"""
 
 
+_DEFAULTS = {
+    "title": "Transform Your Business Today",
+    "subtitle": "Powerful Solutions for Modern Challenges",
+    "description": "Join thousands of companies who trust our platform to grow their business. Get started with our comprehensive suite of tools designed for success.",
+    "primaryButton": "Get Started Free",
+    "secondaryButton": "Learn More",
+    "background": "gradient",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    subtitle = props["subtitle"]
+    description = props["description"]
+    primary_button = props["primaryButton"]
+    secondary_button = props["secondaryButton"]
+    background = props["background"]  # gradient, image, solid
+
+    # Support for nested components
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+        primary_button = found.get("primary_button", primary_button)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+
+    # Background styling based on background prop
+    if background == "gradient":
+        bg_class = "bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800"
+    elif background == "solid":
+        bg_class = "bg-blue-600"
+    elif background == "image":
+        bg_class = "bg-gray-900 bg-cover bg-center"
+        # Note: In real implementation, you'd add background-image via props
+    else:
+        bg_class = "bg-gradient-to-br from-blue-600 via-purple-600 to-blue-800"
+
+    return _TEMPLATE.format(
+        bg_class=bg_class,
+        title=title,
+        subtitle=subtitle,
+        description=description,
+        primary_button=primary_button,
+        secondary_button=secondary_button,
+    )
+
+
 # Register with token "ho"
 COMPONENT_TOKEN = "ho"
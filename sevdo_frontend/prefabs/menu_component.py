@@ -1,51 +1,11 @@
 # sevdo_frontend/prefabs/menu_component.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Menu")
-    orientation = props.get("orientation", "horizontal")  # horizontal or vertical
-    items = props.get("items", ["Home", "About", "Services", "Contact"])
-    brand_text = props.get("brandText", "Brand")
-    
-    # Support for nested components 
-    # If the args is a nested structure like "h(Custom Title)" 
-    # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # Replace title/brand if h() token is found  
-                    if node.token == "h" and node.args:
-                        brand_text = node.args
-                    # Replace orientation if o() token is found
-                    elif node.token == "o" and node.args:
-                        orientation = node.args
-                    # Replace items if m() token is found (comma-separated)
-                    elif node.token == "m" and node.args:
-                        items = [item.strip() for item in node.args.split(",")]
-        except Exception:
-            # If parsing fails, just use args as the brand text
-            brand_text = args
-    
-    # Generate menu items
-    if orientation == "vertical":
-        # Vertical menu (sidebar style)
-        menu_items = "\n".join([
-            f'    <li><a href="#" className="block px-4 py-2 text-gray-700 hover:bg-gray-100 hover:text-blue-600 transition-colors duration-200">{item}</a></li>'
-            for item in items
-        ])
-        
-        return f"""<div className="w-64 bg-white border-r border-gray-200 shadow-sm">
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "brand_text", "o": "orientation", "m": "items"}
+
+
+_VERTICAL_TEMPLATE = """<div className="w-64 bg-white border-r border-gray-200 shadow-sm">
   <div className="px-6 py-4 border-b border-gray-200">
     <h2 className="text-lg font-semibold text-gray-800">{brand_text}</h2>
   </div>
@@ -55,15 +15,8 @@ def render_prefab(args, props):
     </ul>
   </nav>
 </div>"""
-    
-    else:
-        # Horizontal menu (navbar style)
-        menu_items = "\n".join([
-            f'        <a href="#" className="text-gray-700 hover:text-blue-600 px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">{item}</a>'
-            for item in items
-        ])
-        
-        return f"""<nav className="bg-white shadow-sm border-b border-gray-200">
+
+_HORIZONTAL_TEMPLATE = """<nav className="bg-white shadow-sm border-b border-gray-200">
   <div className="max-w-6xl mx-auto px-4">
     <div className="flex justify-between items-center py-4">
       <div className="flex items-center">
@@ -83,5 +36,55 @@ def render_prefab(args, props):
   </div>
 </nav>"""
 
+
+_DEFAULTS = {
+    "title": "Menu",
+    "orientation": "horizontal",
+    "brandText": "Brand",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    orientation = props["orientation"]  # horizontal or vertical
+    items = props.get("items", ["Home", "About", "Services", "Contact"])
+    brand_text = props["brandText"]
+    
+    # Support for nested components 
+    # If the args is a nested structure like "h(Custom Title)" 
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        brand_text = found.get("brand_text", brand_text)
+        orientation = found.get("orientation", orientation)
+        if "items" in found:
+            items = [item.strip() for item in found["items"].split(",")]
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        brand_text = args
+    
+    # Generate menu items
+    if orientation == "vertical":
+        # Vertical menu (sidebar style)
+        menu_items = "\n".join([
+            f'    <li><a href="#" className="block px-4 py-2 text-gray-700 hover:bg-gray-100 hover:text-blue-600 transition-colors duration-200">{item}</a></li>'
+            for item in items
+        ])
+        
+        return _VERTICAL_TEMPLATE.format(brand_text=brand_text, menu_items=menu_items)
+    
+    else:
+        # Horizontal menu (navbar style)
+        menu_items = "\n".join([
+            f'        <a href="#" className="text-gray-700 hover:text-blue-600 px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">{item}</a>'
+            for item in items
+        ])
+        
+        return _HORIZONTAL_TEMPLATE.format(brand_text=brand_text, menu_items=menu_items)
+
 # Register with token "mn"
 COMPONENT_TOKEN = "mn"
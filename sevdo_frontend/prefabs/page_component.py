@@ -1,50 +1,11 @@
 # sevdo_frontend/prefabs/page_component.py
-def render_prefab(args, props):
-    # Default values
-    title = props.get("title", "Page Title")
-    nav_title = props.get("navTitle", "My Website")
-    content = props.get("content", "Welcome to this page!")
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
-    footer_text = props.get("footerText", "© 2025 My Website. All rights reserved.")
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "c": "content", "n": "nav_title"}
 
-    # Support for nested components
-    # If the args is a nested structure like "h(Custom Title)"
- 
-    # we can extract and use those values
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
- 
-        # Get the parent directory path
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        # Import directly from the file
-        from frontend_compiler import parse_dsl, _jsx_for_token
- 
-        try:
-            # Try to parse args as DSL
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
- 
-                    # Replace title if h() token is found
- 
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    # Replace content if c() token is found
-                    elif node.token == "c" and node.args:
-                        content = node.args
-                    # Replace nav title if n() token is found
-                    elif node.token == "n" and node.args:
-                        nav_title = node.args
-        except Exception:
-            # If parsing fails, just use args as the title
-            title = args
- 
-    # Generate full page layout with customized parts
-    return f"""<div className="min-h-screen flex flex-col">
+
+_TEMPLATE = """<div className="min-h-screen flex flex-col">
   <header className="bg-blue-600 text-white shadow-lg">
     <nav className="max-w-6xl mx-auto px-4 py-3">
       <div className="flex items-center justify-between">
@@ -74,6 +35,47 @@ def render_prefab(args, props):
   </footer>
 </div>"""
 
+
+_DEFAULTS = {
+    "title": "Page Title",
+    "navTitle": "My Website",
+    "content": "Welcome to this page!",
+    "footerText": "© 2025 My Website. All rights reserved.",
+}
+
+
+@cached_prefab
+def render_prefab(args, props):
+    # Default values
+    props = _DEFAULTS | props
+    title = props["title"]
+    nav_title = props["navTitle"]
+    content = props["content"]
+
+    footer_text = props["footerText"]
+
+    # Support for nested components
+    # If the args is a nested structure like "h(Custom Title)"
+ 
+    # we can extract and use those values
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        content = found.get("content", content)
+        nav_title = found.get("nav_title", nav_title)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
+ 
+    # Generate full page layout with customized parts
+    return _TEMPLATE.format(
+        nav_title=nav_title,
+        title=title,
+        content=content,
+        footer_text=footer_text,
+    )
+
  
 # Register with token "pg"
 COMPONENT_TOKEN = "pg"
@@ -1,11 +1,46 @@
 # sevdo_frontend/prefabs/pricing_table.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title", "t": "subtitle", "b": "cta_text"}
+
+
+_TEMPLATE = """<section className="py-16 bg-gray-50">
+  <div className="max-w-7xl mx-auto px-4">
+    <div className="text-center mb-12">
+      <h2 className="text-4xl font-bold text-gray-900 mb-4">{title}</h2>
+      <p className="text-xl text-gray-600 max-w-3xl mx-auto">{subtitle}</p>
+    </div>
+    <div className="grid md:grid-cols-3 gap-8 max-w-6xl mx-auto">{pricing_cards}
+    </div>
+    <div className="text-center mt-12">
+      <p className="text-gray-600 mb-4">All plans include a 14-day free trial. No credit card required.</p>
+      <p className="text-sm text-gray-500">
+        Need something custom? <a href="#" className="text-blue-600 hover:text-blue-700 font-semibold">Contact us</a> for enterprise solutions.
+      </p>
+    </div>
+  </div>
+</section>"""
+
+
+_DEFAULTS = {
+    "title": "Choose Your Plan",
+    "subtitle": "Simple, transparent pricing that grows with you",
+    "currency": "$",
+    "period": "month",
+    "ctaText": "Get Started",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
-    title = props.get("title", "Choose Your Plan")
-    subtitle = props.get("subtitle", "Simple, transparent pricing that grows with you")
-    currency = props.get("currency", "$")
-    period = props.get("period", "month")
-    cta_text = props.get("ctaText", "Get Started")
+    props = _DEFAULTS | props
+    title = props["title"]
+    subtitle = props["subtitle"]
+    currency = props["currency"]
+    period = props["period"]
+    cta_text = props["ctaText"]
 
     # Default pricing plans
     default_plans = [
@@ -62,31 +97,20 @@ def render_prefab(args, props):
     ]
 
     # Support for nested components
-    if args:
-        import sys
-        import os
-
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
-
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-                    elif node.token == "t" and node.args:
-                        subtitle = node.args
-                    elif node.token == "b" and node.args:
-                        cta_text = node.args
-                        # Update all plans with new CTA text
-                        for plan in default_plans:
-                            if plan["cta_style"] == "primary":
-                                plan["cta"] = node.args
-        except Exception:
-            title = args if args else title
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+        subtitle = found.get("subtitle", subtitle)
+        if "cta_text" in found:
+            cta_text = found["cta_text"]
+            # Update all plans with new CTA text
+            for plan in default_plans:
+                if plan["cta_style"] == "primary":
+                    plan["cta"] = cta_text
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
 
     # Generate pricing cards
     pricing_cards = ""
@@ -142,22 +166,7 @@ def render_prefab(args, props):
             </button>
         </div>'''
 
-    return f"""<section className="py-16 bg-gray-50">
-  <div className="max-w-7xl mx-auto px-4">
-    <div className="text-center mb-12">
-      <h2 className="text-4xl font-bold text-gray-900 mb-4">{title}</h2>
-      <p className="text-xl text-gray-600 max-w-3xl mx-auto">{subtitle}</p>
-    </div>
-    <div className="grid md:grid-cols-3 gap-8 max-w-6xl mx-auto">{pricing_cards}
-    </div>
-    <div className="text-center mt-12">
-      <p className="text-gray-600 mb-4">All plans include a 14-day free trial. No credit card required.</p>
-      <p className="text-sm text-gray-500">
-        Need something custom? <a href="#" className="text-blue-600 hover:text-blue-700 font-semibold">Contact us</a> for enterprise solutions.
-      </p>
-    </div>
-  </div>
-</section>"""
+    return _TEMPLATE.format(title=title, subtitle=subtitle, pricing_cards=pricing_cards)
 
 
 # Register with token "pt"
@@ -1,7 +1,29 @@
 # sevdo_frontend/prefabs/testimonials.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
+
+# Nested DSL token -> field it overrides
+_SLOTS = {"h": "title"}
+
+
+_TEMPLATE = """<section className="py-12 bg-gray-50">
+  <div className="max-w-6xl mx-auto px-4">
+    <h2 className="text-3xl font-bold text-center text-gray-900 mb-12">{title}</h2>
+    <div className="grid md:grid-cols-3 gap-8">{testimonial_cards}
+    </div>
+  </div>
+</section>"""
+
+
+_DEFAULTS = {
+    "title": "What Our Customers Say",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
-    title = props.get("title", "What Our Customers Say")
+    props = _DEFAULTS | props
+    title = props["title"]
     testimonials_data = [
         {
             "name": "Sarah Johnson",
@@ -21,24 +43,13 @@ def render_prefab(args, props):
     ]
 
     # Support for nested components
-    if args:
-        # Import parser when needed to avoid circular imports
-        import sys
-        import os
-
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl, _jsx_for_token
-
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    if node.token == "h" and node.args:
-                        title = node.args
-        except Exception:
-            title = args if args else title
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        title = found.get("title", title)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        title = args
 
     # Generate testimonial cards
     testimonial_cards = ""
@@ -55,13 +66,7 @@ def render_prefab(args, props):
       </div>
     </div>'''
 
-    return f"""<section className="py-12 bg-gray-50">
-  <div className="max-w-6xl mx-auto px-4">
-    <h2 className="text-3xl font-bold text-center text-gray-900 mb-12">{title}</h2>
-    <div className="grid md:grid-cols-3 gap-8">{testimonial_cards}
-    </div>
-  </div>
-</section>"""
+    return _TEMPLATE.format(title=title, testimonial_cards=testimonial_cards)
 
 
 # Register with token "tt"
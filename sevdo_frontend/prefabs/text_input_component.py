@@ -1,41 +1,50 @@
 # sevdo_frontend/prefabs/text_input_component.py
+from _dsl import cached_prefab, collect_args, parse_dsl_safe
 
+# Nested DSL token -> field it overrides
+_SLOTS = {"t": "label", "h": "label", "p": "placeholder"}
+
+
+_DEFAULTS = {
+    "label": "Label",
+    "placeholder": "Type here...",
+    "name": "textInput",
+    "type": "text",
+    "size": "md",
+    "variant": "default",
+    "helperText": "",
+    "required": False,
+    "disabled": False,
+    "class": "",
+}
+
+
+@cached_prefab
 def render_prefab(args, props):
     # Default values
-    label = props.get("label", "Label")
-    placeholder = props.get("placeholder", "Type here...")
-    name_attr = props.get("name", "textInput")
+    props = _DEFAULTS | props
+    label = props["label"]
+    placeholder = props["placeholder"]
+    name_attr = props["name"]
     # text | email | password | search | number
-    input_type = props.get("type", "text")
-    size = props.get("size", "md")  # sm | md | lg
+    input_type = props["type"]
+    size = props["size"]  # sm | md | lg
     # default | success | danger | warning
-    variant = props.get("variant", "default")
-    helper_text = props.get("helperText", "")
-    required = props.get("required", False)
-    disabled = props.get("disabled", False)
-    extra_class = props.get("class", "")
+    variant = props["variant"]
+    helper_text = props["helperText"]
+    required = props["required"]
+    disabled = props["disabled"]
+    extra_class = props["class"]
 
     # Support for nested components and DSL overrides
-    if args:
-        import sys
-        import os
-        parent_dir = os.path.dirname(
-            os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        from frontend_compiler import parse_dsl
-        try:
-            nodes = parse_dsl(args)
-            if nodes:
-                for node in nodes:
-                    # t() maps to label text, p() maps to placeholder
-                    if node.token in ("t", "h") and node.args:
-                        label = node.args
-                    elif node.token == "p" and node.args:
-                        placeholder = node.args
-        except Exception:
-            # If parsing fails, treat raw args as the label
-            label = args
+    nodes = parse_dsl_safe(args) if args and "(" in args else None
+    if nodes is not None:
+        found = collect_args(nodes, _SLOTS)
+        label = found.get("label", label)
+        placeholder = found.get("placeholder", placeholder)
+    elif args:
+        # Plain text, or DSL that fails to parse, is used as-is
+        label = args
 
     # Size-based classes
     if size == "sm":
@@ -1,5 +1,7 @@
 import importlib
 
+import pytest
+
 
 def test_round_trip_tokens_to_code_and_back():
     mod = importlib.import_module("sevdo_backend.backend_compiler")
@@ -23,3 +25,91 @@ def test_write_if_changed(tmp_path):
     # Different content should be True again
     changed3 = mod._write_if_changed(str(out), "print('b')\n")
     assert changed3 is True
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    cache = mod.SimpleTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Touching "a" makes "b" the eviction candidate
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_stats_counts_hits_and_misses():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    cache = mod.SimpleTTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def _generated_login_namespace():
+    # The generated app connects to Postgres at import time, so exec only the
+    # pieces login needs and back them with an in-memory SQLite database
+    import ast
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    code = mod.BackendCompiler().tokens_to_code(["r", "l"], include_imports=True)
+    keep_assigns = {"Base", "pwd_context", "BCRYPT_PREFIXES"}
+    body = []
+    for node in ast.parse(code).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if getattr(node, "module", None) != "dotenv":
+                body.append(node)
+        elif isinstance(node, ast.Assign):
+            if {getattr(t, "id", None) for t in node.targets} & keep_assigns:
+                body.append(node)
+        elif isinstance(node, ast.ClassDef):
+            body.append(node)
+        elif isinstance(node, ast.FunctionDef) and node.name == "get_db":
+            body.append(node)
+        elif isinstance(node, ast.FunctionDef) and node.name == "login_endpoint":
+            node.decorator_list = []
+            body.append(node)
+    ns = {}
+    exec(compile(ast.Module(body=body, type_ignores=[]), "<generated>", "exec"), ns)
+    engine = create_engine("sqlite://")
+    ns["Base"].metadata.create_all(engine)
+    return ns, Session(engine)
+
+
+def test_generated_login_verifies_argon2_and_legacy_bcrypt():
+    pytest.importorskip("argon2")
+    bcrypt = pytest.importorskip("bcrypt")
+    from fastapi import HTTPException
+
+    ns, db = _generated_login_namespace()
+    login, User, UserDB = ns["login_endpoint"], ns["User"], ns["UserDB"]
+    legacy_hash = bcrypt.hashpw(b"old-secret", bcrypt.gensalt(rounds=4)).decode()
+    db.add_all(
+        [
+            UserDB(username="new", password=ns["pwd_context"].hash("new-secret")),
+            UserDB(username="legacy", password=legacy_hash),
+        ]
+    )
+    db.commit()
+
+    assert login(User(username="new", password="new-secret"), db=db)["session_token"]
+
+    # Legacy bcrypt hashes still log in and are upgraded to Argon2id
+    assert login(User(username="legacy", password="old-secret"), db=db)["session_token"]
+    legacy = db.query(UserDB).filter(UserDB.username == "legacy").one()
+    assert legacy.password.startswith("$argon2id$")
+    assert login(User(username="legacy", password="old-secret"), db=db)["session_token"]
+
+    for username in ("new", "legacy"):
+        with pytest.raises(HTTPException) as exc:
+            login(User(username=username, password="wrong"), db=db)
+        assert exc.value.status_code == 401
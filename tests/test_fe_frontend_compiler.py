@@ -185,3 +185,40 @@ async def test_fe_nesting_render(tmp_path):
 		assert "<form>" in jsx
 		assert "onClick={save}" in jsx
 
+
+
+def _render(dsl):
+	mod = importlib.import_module("sevdo_frontend.frontend_compiler")
+	return mod.dsl_to_jsx(dsl, include_imports=False)
+
+
+def test_fe_prefab_plain_text_args():
+	# Plain-text args skip the DSL parser and become the prefab's text/title
+	jsx = _render("b(Save)")
+	assert ">Save</button>" in jsx
+	assert "Click" not in jsx
+
+	jsx = _render("lf(Welcome back)")
+	assert "<h1>Welcome back</h1>" in jsx
+	assert "Login to Your Account" not in jsx
+	assert ">Sign In</button>" in jsx
+
+	jsx = _render("rf(Join us)")
+	assert "<h1>Join us</h1>" in jsx
+	assert "Create Your Account" not in jsx
+	assert ">Register</button>" in jsx
+
+	jsx = _render("cf(Say hello)")
+	assert ">Say hello</h2>" in jsx
+	assert "Get in Touch" not in jsx
+
+
+def test_fe_prefab_nested_dsl_args():
+	# Args containing tokens still go through the parser and fill named slots
+	jsx = _render("b(t(Send now))")
+	assert ">Send now</button>" in jsx
+
+	jsx = _render("lf(h(Hi) b(Go))")
+	assert "<h1>Hi</h1>" in jsx
+	assert ">Go</button>" in jsx
+	assert ">Forgot Password?</button>" in jsx
@@ -1,13 +1,14 @@
-from datetime import datetime, timezone
 from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 import json
+import re
 
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from user_backend.app.models import (
     AIConversation,
+    AIMessage,
     ProjectType,
     User,
     Project,
@@ -159,35 +160,55 @@ DESCRIPTION_TO_TOKENS = {
     "form": ["c"],
 }
 
+# Finds every keyword in one scan; the lookahead keeps overlapping hits, matching
+# the per-keyword substring checks it replaces (no keyword prefixes another)
+_DESCRIPTION_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in DESCRIPTION_TO_TOKENS) + "))"
+)
+
+
+# Registration, login and profile: the baseline for anything with user accounts
+ACCOUNT_TOKENS = ("r", "l", "m")
+
+# Follow-up prompts returned with every chat reply
+CHAT_FOLLOW_UP_SUGGESTIONS = (
+    "What specific features do you need?",
+    "Should users be able to create accounts?",
+    "Do you need a contact form?",
+    "Will you need file uploads?",
+)
+
+# Generic hints returned with every website description analysis
+ANALYSIS_SUGGESTIONS = (
+    "Consider adding more details about your target audience",
+    "Specify the main goal of your website",
+)
+
 
 def suggest_tokens_from_description(
     description: str, project_type: ProjectType = None
 ) -> List[str]:
     """AI-powered token suggestion based on description"""
     description_lower = description.lower()
-    suggested_tokens = set()
+    suggested_tokens: set[str] = set()
 
     # Analyze keywords in description
-    for keyword, tokens in DESCRIPTION_TO_TOKENS.items():
-        if keyword in description_lower:
-            suggested_tokens.update(tokens)
+    for keyword in set(_DESCRIPTION_KEYWORD_RE.findall(description_lower)):
+        suggested_tokens.update(DESCRIPTION_TO_TOKENS[keyword])
 
     # Add default tokens based on project type
     if project_type == ProjectType.WEB_APP:
-        suggested_tokens.update(["c"])  # Most websites need contact
+        suggested_tokens.add("c")  # Most websites need contact
     elif project_type == ProjectType.API_BACKEND:
-        suggested_tokens.update(["r", "l", "m"])  # APIs usually need auth
-
-    # Convert to list and ensure logical dependencies
-    tokens = list(suggested_tokens)
+        suggested_tokens.update(ACCOUNT_TOKENS)  # APIs usually need auth
 
     # Add dependencies
-    if "e" in tokens and "r" not in tokens:  # E-commerce needs user accounts
-        tokens.extend(["r", "l", "m"])
-    if "u" in tokens and "l" not in tokens:  # Profile updates need login
-        tokens.extend(["r", "l", "m"])
+    if "e" in suggested_tokens and "r" not in suggested_tokens:
+        suggested_tokens.update(ACCOUNT_TOKENS)  # E-commerce needs user accounts
+    if "u" in suggested_tokens and "l" not in suggested_tokens:
+        suggested_tokens.update(ACCOUNT_TOKENS)  # Profile updates need login
 
-    return list(set(tokens))  # Remove duplicates
+    return list(suggested_tokens)
 
 
 def tokens_to_features(tokens: List[str]) -> List[ProjectFeatureSchema]:
@@ -248,7 +269,7 @@ async def create_project_from_description(
         if not validation["is_valid"]:
             # Fix issues automatically where possible
             if "e" in suggested_tokens and "r" not in suggested_tokens:
-                suggested_tokens.extend(["r", "l", "m"])
+                suggested_tokens.extend(ACCOUNT_TOKENS)
                 validation = validate_token_combination(suggested_tokens)
 
         # Convert tokens to user-friendly features
@@ -277,8 +298,8 @@ async def create_project_from_description(
         )
 
         db.add(new_project)
+        # id is populated by the flush; nothing else is read back
         db.commit()
-        db.refresh(new_project)
 
         logger.info(
             f"AI project created successfully",
@@ -319,29 +340,21 @@ async def ai_chat(
                 user_id=current_user.id, project_id=chat_request.project_id
             )
             db.add(conversation)
-            db.commit()
-            db.refresh(conversation)
+            # Flush for the id; the whole exchange commits once below
+            db.flush()
             conversation_id = conversation.id
         else:
-            conversation = db.execute(
-                select(AIConversation).where(AIConversation.id == conversation_id)
-            ).scalar_one_or_none()
+            # Messages are inserted by id, so only existence needs checking
+            exists = db.scalar(
+                select(AIConversation.id).where(AIConversation.id == conversation_id)
+            )
 
-            if not conversation:
+            if exists is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Conversation not found",
                 )
 
-        # Add user message to conversation
-        conversation.messages.append(
-            {
-                "role": "user",
-                "content": chat_request.message,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
-
         # Analyze message for feature suggestions
         suggested_tokens = suggest_tokens_from_description(chat_request.message)
         suggested_features = tokens_to_features(suggested_tokens)
@@ -357,34 +370,35 @@ async def ai_chat(
             )
             response_content += "Can you provide more details about the specific functionality you need?"
 
-        # Add AI response to conversation
-        conversation.messages.append(
-            {
-                "role": "assistant",
-                "content": response_content,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "suggested_features": [f.dict() for f in suggested_features],
-            }
+        # Append both messages as new rows; the conversation row is untouched
+        db.add_all(
+            [
+                AIMessage(
+                    conversation_id=conversation_id,
+                    role="user",
+                    content=chat_request.message,
+                ),
+                AIMessage(
+                    conversation_id=conversation_id,
+                    role="assistant",
+                    content=response_content,
+                    suggested_features=[f.dict() for f in suggested_features],
+                ),
+            ]
         )
-
         db.commit()
 
-        # Generate follow-up suggestions
-        suggestions = [
-            "What specific features do you need?",
-            "Should users be able to create accounts?",
-            "Do you need a contact form?",
-            "Will you need file uploads?",
-        ]
-
         return AIChatResponseSchema(
             response=response_content,
-            suggestions=suggestions,
+            suggestions=CHAT_FOLLOW_UP_SUGGESTIONS,
             suggested_tokens=suggested_tokens,  # Keep for backward compatibility
             conversation_id=conversation_id,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
+        db.rollback()
         logger.error(f"AI chat failed: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -413,10 +427,7 @@ async def analyze_website_description(
             "success": True,
             "detected_elements": detected_elements,
             "confidence": 0.85,
-            "suggestions": [
-                "Consider adding more details about your target audience",
-                "Specify the main goal of your website",
-            ],
+            "suggestions": ANALYSIS_SUGGESTIONS,
         }
 
     except Exception as e:
@@ -431,29 +442,50 @@ def analyze_description_advanced(description: str) -> dict:
     # Implement your AI logic here
     # This is where you'd integrate with your preferred AI service
 
+    desc_lower = description.lower()
+
     return {
         "navigation": True,
         "hero": True,
-        "services": "service" in description.lower(),
-        "contact": "contact" in description.lower(),
+        "services": "service" in desc_lower,
+        "contact": "contact" in desc_lower,
         "businessType": detect_business_type(description),
     }
 
 
+BUSINESS_KEYWORDS = {
+    "restaurant": ("restaurant", "food", "menu", "dining"),
+    "medical": ("doctor", "medical", "health", "clinic"),
+    "ecommerce": ("shop", "store", "products", "buy"),
+    "portfolio": ("portfolio", "work", "showcase", "gallery"),
+    # Add more business types as needed
+}
+
+_KEYWORD_TO_BUSINESS_TYPE = {
+    keyword: business_type
+    for business_type, keywords in BUSINESS_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# Same single-scan lookahead as _DESCRIPTION_KEYWORD_RE, so a keyword nested in
+# another ("shop" in "workshop") is still found
+_BUSINESS_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(keyword) for keyword in _KEYWORD_TO_BUSINESS_TYPE)
+    + "))"
+)
+
+
 def detect_business_type(description: str) -> str:
     """Detect the type of business from description"""
-    desc_lower = description.lower()
-
-    business_keywords = {
-        "restaurant": ["restaurant", "food", "menu", "dining"],
-        "medical": ["doctor", "medical", "health", "clinic"],
-        "ecommerce": ["shop", "store", "products", "buy"],
-        "portfolio": ["portfolio", "work", "showcase", "gallery"],
-        # Add more business types as needed
+    found = {
+        _KEYWORD_TO_BUSINESS_TYPE[keyword]
+        for keyword in _BUSINESS_KEYWORD_RE.findall(description.lower())
     }
 
-    for business_type, keywords in business_keywords.items():
-        if any(keyword in desc_lower for keyword in keywords):
+    # First type in BUSINESS_KEYWORDS order wins, as before
+    for business_type in BUSINESS_KEYWORDS:
+        if business_type in found:
             return business_type
 
     return "general"
@@ -1,10 +1,15 @@
 # user_backend/app/api/v1/core/endpoints/auth.py - Enhanced Error Handling
 
+import logging
+from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
-from fastapi import APIRouter, Depends, Request, status, HTTPException
+from fastapi import APIRouter, Depends, Request, Response, status, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
 import re
 
 from user_backend.app.core import security
@@ -31,16 +36,57 @@ from user_backend.app.core.exceptions import (
     ValidationError,
 )
 from user_backend.app.core.logging_config import StructuredLogger, security_logger
+from user_backend.app.core.responses import json_response
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = StructuredLogger(__name__)
 
 
+@lru_cache(maxsize=10_000)
+def _serialize_user(
+    user_id: int,
+    first_name: str,
+    last_name: str,
+    email: str,
+    user_type_id: int,
+    created_at: datetime,
+) -> bytes:
+    """
+    Serialized UserOutSchema keyed on every field it exposes, so a profile or
+    email change simply misses the cache instead of needing eviction.
+    The values come straight from the loaded User row, so validation is skipped
+    """
+    return UserOutSchema.model_construct(
+        id=user_id,
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        user_type_id=user_type_id,
+        created_at=created_at,
+    ).model_dump_json().encode()
+
+
+def _user_response(user: User) -> Response:
+    """JSON response for a user profile, reusing the cached serialization"""
+    return Response(
+        content=_serialize_user(
+            user.id,
+            user.first_name,
+            user.last_name,
+            user.email,
+            user.user_type_id,
+            user.created_at,
+        ),
+        media_type="application/json",
+    )
+
+
 def get_client_ip(request: Request) -> str:
     """Extract client IP address from request"""
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        # partition avoids building a list of every hop in the chain
+        return forwarded_for.partition(",")[0].strip()
 
     real_ip = request.headers.get("X-Real-IP")
     if real_ip:
@@ -140,8 +186,8 @@ async def login(
     """
     Enhanced user login endpoint with detailed error messages
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
         user_agent = request.headers.get("user-agent", "unknown")
 
         # Basic input validation
@@ -157,16 +203,9 @@ async def login(
         except ValidationError as e:
             raise HTTPException(status_code=422, detail=str(e))
 
-        logger.info(
-            f"Login attempt for email: {clean_email}",
-            email=clean_email,
-            ip_address=client_ip,
-            user_agent=user_agent,
-        )
-
         # Authenticate user
         try:
-            user = security_service.authenticate_user(
+            user = await security_service.authenticate_user(
                 email=clean_email,
                 password=form_data.password,
                 db=db,
@@ -175,7 +214,8 @@ async def login(
         except InvalidCredentialsError:
             # Log failed attempt
             logger.warning(
-                f"Failed login attempt for email: {clean_email}",
+                "Failed login attempt for email: %s",
+                clean_email,
                 email=clean_email,
                 ip_address=client_ip,
                 reason="invalid_credentials",
@@ -190,29 +230,37 @@ async def login(
             user_id=user.id, db=db, token_type="access"
         )
 
+        # One event per login; the message is only formatted if INFO is enabled
         logger.info(
-            f"Successful login for user: {user.email}",
+            "Successful login for user: %s",
+            user.email,
             user_id=user.id,
             email=user.email,
             ip_address=client_ip,
+            user_agent=user_agent,
+            outcome="success",
         )
 
-        return TokenResponseSchema(
-            access_token=token.token,
-            token_type="bearer",
-            expires_in=security.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        return ORJSONResponse(
+            {
+                "access_token": token.token,
+                "token_type": "bearer",
+                "expires_in": security.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            }
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(
-            f"Login failed for email: {form_data.username}",
-            email=form_data.username,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Login failed for email: %s",
+                form_data.username,
+                email=form_data.username,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise HTTPException(
             status_code=500,
             detail="Login failed due to server error. Please try again later.",
@@ -230,11 +278,12 @@ async def register(
     """
     Enhanced user registration endpoint with detailed validation
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Registration attempt for email: {user_data.email}",
+            "Registration attempt for email: %s",
+            user_data.email,
             email=user_data.email,
             ip_address=client_ip,
         )
@@ -256,13 +305,14 @@ async def register(
             raise HTTPException(status_code=422, detail=str(e))
 
         # Check if user already exists
-        existing_user = (
-            db.execute(select(User).where(User.email == clean_email)).scalars().first()
+        existing_id = db.scalar(
+            select(User.id).where(User.email == clean_email).limit(1)
         )
 
-        if existing_user:
+        if existing_id is not None:
             logger.warning(
-                f"Registration failed - user already exists: {clean_email}",
+                "Registration failed - user already exists: %s",
+                clean_email,
                 email=clean_email,
                 ip_address=client_ip,
             )
@@ -272,7 +322,7 @@ async def register(
             )
 
         # Create new user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await run_in_threadpool(hash_password, user_data.password)
 
         new_user = User(
             first_name=clean_first_name,
@@ -283,29 +333,35 @@ async def register(
         )
 
         db.add(new_user)
+        # No refresh: created_at (server default) comes back with the INSERT
         db.commit()
-        db.refresh(new_user)
 
         logger.info(
-            f"User registered successfully: {new_user.email}",
+            "User registered successfully: %s",
+            new_user.email,
             user_id=new_user.id,
             email=new_user.email,
             ip_address=client_ip,
         )
 
-        return UserOutSchema.model_validate(new_user)
+        return json_response(
+            UserOutSchema.model_validate(new_user),
+            status_code=status.HTTP_201_CREATED,
+        )
 
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Registration failed for email: {user_data.email}",
-            email=user_data.email,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Registration failed for email: %s",
+                user_data.email,
+                email=user_data.email,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise HTTPException(
             status_code=500,
             detail="Registration failed due to server error. Please try again later.",
@@ -321,20 +377,23 @@ async def get_current_user_profile(
     """
     try:
         logger.info(
-            f"Profile access for user: {current_user.email}",
+            "Profile access for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
         )
 
-        return UserOutSchema.model_validate(current_user)
+        return _user_response(current_user)
 
     except Exception as e:
-        logger.error(
-            f"Failed to get user profile: {str(e)}",
-            user_id=current_user.id,
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Failed to get user profile: %s",
+                e,
+                user_id=current_user.id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve user profile. Please try again later.",
@@ -351,75 +410,85 @@ async def update_current_user_profile(
     """
     Enhanced update current user profile with validation
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Profile update attempt for user: {current_user.email}",
+            "Profile update attempt for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
         # Enhanced validation
+        dirty = False
         try:
             if user_data.first_name is not None:
                 clean_first_name = validate_name(user_data.first_name, "First name")
-                current_user.first_name = clean_first_name
+                if clean_first_name != current_user.first_name:
+                    current_user.first_name = clean_first_name
+                    dirty = True
 
             if user_data.last_name is not None:
                 clean_last_name = validate_name(user_data.last_name, "Last name")
-                current_user.last_name = clean_last_name
+                if clean_last_name != current_user.last_name:
+                    current_user.last_name = clean_last_name
+                    dirty = True
 
             if user_data.email is not None:
                 clean_email = validate_email(user_data.email)
 
                 # Check if email is being changed and if new email already exists
                 if clean_email != current_user.email:
-                    existing_user = (
-                        db.execute(
-                            select(User).where(
-                                User.email == clean_email, User.id != current_user.id
-                            )
-                        )
-                        .scalars()
-                        .first()
+                    existing_id = db.scalar(
+                        select(User.id)
+                        .where(User.email == clean_email, User.id != current_user.id)
+                        .limit(1)
                     )
 
-                    if existing_user:
+                    if existing_id is not None:
                         raise HTTPException(
                             status_code=409,
                             detail="An account with this email address already exists. Please use a different email.",
                         )
 
-                current_user.email = clean_email
+                    current_user.email = clean_email
+                    dirty = True
 
         except ValidationError as e:
             raise HTTPException(status_code=422, detail=str(e))
 
+        # Nothing differs from the stored profile; skip the commit round trip
+        if not dirty:
+            return _user_response(current_user)
+
+        # Only client-set columns changed, so the in-memory user is current
         db.commit()
-        db.refresh(current_user)
 
         logger.info(
-            f"Profile updated successfully for user: {current_user.email}",
+            "Profile updated successfully for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
-        return UserOutSchema.model_validate(current_user)
+        return _user_response(current_user)
 
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Profile update failed for user: {current_user.email}",
-            user_id=current_user.id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Profile update failed for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise HTTPException(
             status_code=500,
             detail="Profile update failed due to server error. Please try again later.",
@@ -436,11 +505,12 @@ async def change_password(
     """
     Enhanced change user password with detailed validation
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Password change attempt for user: {current_user.email}",
+            "Password change attempt for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
@@ -469,9 +539,19 @@ async def change_password(
         except ValidationError as e:
             raise HTTPException(status_code=422, detail=str(e))
 
+        # Lock the row so concurrent changes verify against the hash that is
+        # actually being replaced; the lock is released by the commit below
+        stored_hash = db.scalar(
+            select(User.hashed_password)
+            .where(User.id == current_user.id)
+            .with_for_update()
+        )
+
         # Verify current password
-        if not security_service.verify_password(
-            password_data.current_password, current_user.hashed_password
+        if not await run_in_threadpool(
+            security_service.verify_password,
+            password_data.current_password,
+            stored_hash,
         ):
             security_logger.log_suspicious_activity(
                 "Invalid current password during password change attempt",
@@ -484,7 +564,13 @@ async def change_password(
             )
 
         # Hash and update password
-        current_user.hashed_password = hash_password(password_data.new_password)
+        new_hash = await run_in_threadpool(hash_password, password_data.new_password)
+        db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(hashed_password=new_hash)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
         # Log security event
@@ -493,7 +579,8 @@ async def change_password(
         )
 
         logger.info(
-            f"Password changed successfully for user: {current_user.email}",
+            "Password changed successfully for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
@@ -505,13 +592,15 @@ async def change_password(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Password change failed for user: {current_user.email}",
-            user_id=current_user.id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Password change failed for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise HTTPException(
             status_code=500,
             detail="Password change failed due to server error. Please try again later.",
@@ -528,9 +617,9 @@ async def logout(
     db: Session = Depends(get_db),
 ):
     """Logout from current session"""
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
-        logger.info(f"Logout attempt for token: {current_token.token[:8]}...")
+        logger.info("Logout attempt for token: %s...", current_token.token[:8])
 
         db.delete(current_token)
         db.commit()
@@ -540,7 +629,7 @@ async def logout(
 
     except Exception as e:
         db.rollback()
-        logger.error(f"Logout failed: {str(e)}")
+        logger.error("Logout failed: %s", e)
         raise HTTPException(status_code=500, detail="Logout failed. Please try again.")
 
 
@@ -553,11 +642,17 @@ async def logout_all_sessions(
     db: Session = Depends(get_db),
 ):
     """Logout from all sessions"""
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
-        logger.info(f"Logout all sessions for user: {current_user.email}")
-
-        result = db.execute(delete(Token).where(Token.user_id == current_user.id))
+        logger.info("Logout all sessions for user: %s", current_user.email)
+
+        # Nothing in this request reads the deleted tokens back, so skip the
+        # ORM's identity-map sync (which would otherwise fetch the matched ids)
+        result = db.execute(
+            delete(Token)
+            .where(Token.user_id == current_user.id)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
         sessions_count = result.rowcount
@@ -567,7 +662,7 @@ async def logout_all_sessions(
 
     except Exception as e:
         db.rollback()
-        logger.error(f"Logout all sessions failed: {str(e)}")
+        logger.error("Logout all sessions failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Failed to logout from all sessions. Please try again.",
@@ -1,10 +1,15 @@
 # user_backend/app/api/v1/core/endpoints/auth.py
 
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Annotated
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import func, select, delete, update
 
 from user_backend.app.core import security
 from user_backend.app.db_setup import get_db
@@ -30,16 +35,60 @@ from user_backend.app.core.exceptions import (
     ValidationError,
 )
 from user_backend.app.core.logging_config import StructuredLogger, security_logger
+from user_backend.app.core.responses import json_response
 
-router = APIRouter(tags=["authentication"], prefix="/auth")
+router = APIRouter(
+    tags=["authentication"],
+    prefix="/auth",
+    default_response_class=ORJSONResponse,
+)
 logger = StructuredLogger(__name__)
 
 
+@lru_cache(maxsize=10_000)
+def _serialize_user(
+    user_id: int,
+    first_name: str,
+    last_name: str,
+    email: str,
+    user_type_id: int,
+    created_at: datetime,
+) -> bytes:
+    """
+    Serialized UserOutSchema keyed on every field it exposes, so a profile or
+    email change simply misses the cache instead of needing eviction.
+    The values come straight from the loaded User row, so validation is skipped
+    """
+    return UserOutSchema.model_construct(
+        id=user_id,
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        user_type_id=user_type_id,
+        created_at=created_at,
+    ).model_dump_json().encode()
+
+
+def _user_response(user: User) -> Response:
+    """JSON response for a user profile, reusing the cached serialization"""
+    return Response(
+        content=_serialize_user(
+            user.id,
+            user.first_name,
+            user.last_name,
+            user.email,
+            user.user_type_id,
+            user.created_at,
+        ),
+        media_type="application/json",
+    )
+
+
 def get_client_ip(request: Request) -> str:
     """Extract client IP address from request"""
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        return forwarded_for.partition(",")[0].strip()
 
     real_ip = request.headers.get("X-Real-IP")
     if real_ip:
@@ -60,19 +109,12 @@ async def login(
     Authenticates user credentials and returns access token.
     Includes brute force protection and security logging.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
         user_agent = request.headers.get("user-agent", "unknown")
 
-        logger.info(
-            f"Login attempt for email: {form_data.username}",
-            email=form_data.username,
-            ip_address=client_ip,
-            user_agent=user_agent,
-        )
-
         # Authenticate user
-        user = security_service.authenticate_user(
+        user = await security_service.authenticate_user(
             email=form_data.username,
             password=form_data.password,
             db=db,
@@ -84,27 +126,35 @@ async def login(
             user_id=user.id, db=db, token_type="access"
         )
 
+        # One event per login; the message is only formatted if INFO is enabled
         logger.info(
-            f"Successful login for user: {user.email}",
+            "Successful login for user: %s",
+            user.email,
             user_id=user.id,
             email=user.email,
             ip_address=client_ip,
+            user_agent=user_agent,
+            outcome="success",
         )
 
-        return TokenResponseSchema(
-            access_token=token.token,
-            token_type="bearer",
-            expires_in=security.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        return ORJSONResponse(
+            {
+                "access_token": token.token,
+                "token_type": "bearer",
+                "expires_in": security.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+            }
         )
 
     except Exception as e:
-        logger.error(
-            f"Login failed for email: {form_data.username}",
-            email=form_data.username,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Login failed for email: %s",
+                form_data.username,
+                email=form_data.username,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise
 
 
@@ -121,25 +171,25 @@ async def register(
 
     Creates a new user account with validation and security checks.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Registration attempt for email: {user_data.email}",
+            "Registration attempt for email: %s",
+            user_data.email,
             email=user_data.email,
             ip_address=client_ip,
         )
 
         # Check if user already exists
-        existing_user = (
-            db.execute(select(User).where(User.email == user_data.email))
-            .scalars()
-            .first()
+        existing_id = db.scalar(
+            select(User.id).where(User.email == user_data.email).limit(1)
         )
 
-        if existing_user:
+        if existing_id is not None:
             logger.warning(
-                f"Registration failed - user already exists: {user_data.email}",
+                "Registration failed - user already exists: %s",
+                user_data.email,
                 email=user_data.email,
                 ip_address=client_ip,
             )
@@ -149,7 +199,7 @@ async def register(
         security_service.validate_password_strength(user_data.password)
 
         # Create new user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await run_in_threadpool(hash_password, user_data.password)
 
         new_user = User(
             first_name=user_data.first_name.strip(),
@@ -160,29 +210,35 @@ async def register(
         )
 
         db.add(new_user)
+        # No refresh: created_at (server default) comes back with the INSERT
         db.commit()
-        db.refresh(new_user)
 
         logger.info(
-            f"User registered successfully: {new_user.email}",
+            "User registered successfully: %s",
+            new_user.email,
             user_id=new_user.id,
             email=new_user.email,
             ip_address=client_ip,
         )
 
-        return UserOutSchema.model_validate(new_user)
+        return json_response(
+            UserOutSchema.model_validate(new_user),
+            status_code=status.HTTP_201_CREATED,
+        )
 
     except (UserAlreadyExistsError, ValidationError):
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Registration failed for email: {user_data.email}",
-            email=user_data.email,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Registration failed for email: %s",
+                user_data.email,
+                email=user_data.email,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("User registration failed")
 
 
@@ -197,20 +253,23 @@ async def get_current_user_profile(
     """
     try:
         logger.info(
-            f"Profile access for user: {current_user.email}",
+            "Profile access for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
         )
 
-        return UserOutSchema.model_validate(current_user)
+        return _user_response(current_user)
 
     except Exception as e:
-        logger.error(
-            f"Failed to get user profile: {str(e)}",
-            user_id=current_user.id,
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Failed to get user profile: %s",
+                e,
+                user_id=current_user.id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise
 
 
@@ -226,62 +285,77 @@ async def update_current_user_profile(
 
     Allows users to update their profile information.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Profile update attempt for user: {current_user.email}",
+            "Profile update attempt for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
+        dirty = False
+
         # Check if email is being changed and if new email already exists
-        if user_data.email and user_data.email != current_user.email:
-            existing_user = (
-                db.execute(
-                    select(User).where(
-                        User.email == user_data.email, User.id != current_user.id
-                    )
+        if user_data.email is not None:
+            new_email = user_data.email.lower().strip()
+            if new_email != current_user.email:
+                existing_id = db.scalar(
+                    select(User.id)
+                    .where(User.email == new_email, User.id != current_user.id)
+                    .limit(1)
                 )
-                .scalars()
-                .first()
-            )
 
-            if existing_user:
-                raise UserAlreadyExistsError(email=user_data.email)
+                if existing_id is not None:
+                    raise UserAlreadyExistsError(email=new_email)
+
+                current_user.email = new_email
+                dirty = True
 
         # Update user fields
         if user_data.first_name is not None:
-            current_user.first_name = user_data.first_name.strip()
+            first_name = user_data.first_name.strip()
+            if first_name != current_user.first_name:
+                current_user.first_name = first_name
+                dirty = True
         if user_data.last_name is not None:
-            current_user.last_name = user_data.last_name.strip()
-        if user_data.email is not None:
-            current_user.email = user_data.email.lower().strip()
+            last_name = user_data.last_name.strip()
+            if last_name != current_user.last_name:
+                current_user.last_name = last_name
+                dirty = True
 
+        # Nothing differs from the stored profile; skip the commit round trip
+        if not dirty:
+            return _user_response(current_user)
+
+        # Only client-set columns changed, so the in-memory user is current
         db.commit()
-        db.refresh(current_user)
 
         logger.info(
-            f"Profile updated successfully for user: {current_user.email}",
+            "Profile updated successfully for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
-        return UserOutSchema.model_validate(current_user)
+        return _user_response(current_user)
 
     except UserAlreadyExistsError:
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Profile update failed for user: {current_user.email}",
-            user_id=current_user.id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Profile update failed for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Profile update failed")
 
 
@@ -297,19 +371,30 @@ async def change_password(
 
     Allows users to change their password with current password verification.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Password change attempt for user: {current_user.email}",
+            "Password change attempt for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
+        # Lock the row so concurrent changes verify against the hash that is
+        # actually being replaced; the lock is released by the commit below
+        stored_hash = db.scalar(
+            select(User.hashed_password)
+            .where(User.id == current_user.id)
+            .with_for_update()
+        )
+
         # Verify current password
-        if not security_service.verify_password(
-            password_data.current_password, current_user.hashed_password
+        if not await run_in_threadpool(
+            security_service.verify_password,
+            password_data.current_password,
+            stored_hash,
         ):
             security_logger.log_suspicious_activity(
                 "Invalid current password during password change attempt",
@@ -322,7 +407,13 @@ async def change_password(
         security_service.validate_password_strength(password_data.new_password)
 
         # Hash and update password
-        current_user.hashed_password = hash_password(password_data.new_password)
+        new_hash = await run_in_threadpool(hash_password, password_data.new_password)
+        db.execute(
+            update(User)
+            .where(User.id == current_user.id)
+            .values(hashed_password=new_hash)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
         # Log security event
@@ -331,7 +422,8 @@ async def change_password(
         )
 
         logger.info(
-            f"Password changed successfully for user: {current_user.email}",
+            "Password changed successfully for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
@@ -343,13 +435,15 @@ async def change_password(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Password change failed for user: {current_user.email}",
-            user_id=current_user.id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Password change failed for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Password change failed")
 
 
@@ -366,11 +460,12 @@ async def logout(
 
     Invalidates the current access token.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Logout attempt for token: {current_token.token[:8]}...",
+            "Logout attempt for token: %s...",
+            current_token.token[:8],
             user_id=current_token.user_id,
             ip_address=client_ip,
         )
@@ -389,13 +484,15 @@ async def logout(
 
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Logout failed for token: {current_token.token[:8]}...",
-            user_id=current_token.user_id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Logout failed for token: %s...",
+                current_token.token[:8],
+                user_id=current_token.user_id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Logout failed")
 
 
@@ -412,24 +509,32 @@ async def logout_all_sessions(
 
     Invalidates all access tokens for the current user.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Logout all sessions attempt for user: {current_user.email}",
+            "Logout all sessions attempt for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             ip_address=client_ip,
         )
 
         # Delete all tokens for the user
-        result = db.execute(delete(Token).where(Token.user_id == current_user.id))
+        # Nothing in this request reads the deleted tokens back, so skip the
+        # ORM's identity-map sync (which would otherwise fetch the matched ids)
+        result = db.execute(
+            delete(Token)
+            .where(Token.user_id == current_user.id)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
         sessions_count = result.rowcount
 
         logger.info(
-            f"All sessions logged out successfully for user: {current_user.email}",
+            "All sessions logged out successfully for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
             sessions_revoked=sessions_count,
@@ -442,19 +547,22 @@ async def logout_all_sessions(
 
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Logout all sessions failed for user: {current_user.email}",
-            user_id=current_user.id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Logout all sessions failed for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Logout from all sessions failed")
 
 
 @router.get("/sessions", response_model=list)
 async def get_user_sessions(
     current_user: User = Depends(get_current_active_user),
+    current_token: Token = Depends(get_current_token),
     db: Session = Depends(get_db),
 ):
     """
@@ -464,38 +572,49 @@ async def get_user_sessions(
     """
     try:
         logger.info(
-            f"Sessions list request for user: {current_user.email}",
+            "Sessions list request for user: %s",
+            current_user.email,
             user_id=current_user.id,
             email=current_user.email,
         )
 
-        sessions = (
-            db.execute(select(Token).where(Token.user_id == current_user.id))
-            .scalars()
-            .all()
-        )
+        # Project only the listed columns and skip expired tokens; the preview
+        # prefix is cut in SQL so full token strings never leave the database
+        sessions = db.execute(
+            select(
+                Token.id,
+                func.substr(Token.token, 1, 8).label("token_prefix"),
+                Token.created_at,
+                Token.expire_date,
+            ).where(
+                Token.user_id == current_user.id,
+                Token.expire_date > datetime.now(timezone.utc),
+            )
+        ).all()
 
+        current_token_id = current_token.id
         session_list = [
             {
                 "id": session.id,
-                "token_preview": session.token[:8] + "...",
+                "token_preview": session.token_prefix + "...",
                 "created_at": session.created_at,
                 "expires_at": session.expire_date,
-                "is_current": session.token
-                == getattr(current_user, "_current_token", None),
+                "is_current": session.id == current_token_id,
             }
             for session in sessions
         ]
 
-        return session_list
+        return ORJSONResponse(session_list)
 
     except Exception as e:
-        logger.error(
-            f"Failed to get sessions for user: {current_user.email}",
-            user_id=current_user.id,
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Failed to get sessions for user: %s",
+                current_user.email,
+                user_id=current_user.id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Failed to retrieve sessions")
 
 
@@ -511,11 +630,12 @@ async def revoke_session(
 
     Allows users to revoke a specific session/token.
     """
+    client_ip = get_client_ip(request)
     try:
-        client_ip = get_client_ip(request)
 
         logger.info(
-            f"Session revocation attempt for session {session_id}",
+            "Session revocation attempt for session %s",
+            session_id,
             user_id=current_user.id,
             session_id=session_id,
             ip_address=client_ip,
@@ -541,7 +661,8 @@ async def revoke_session(
         db.commit()
 
         logger.info(
-            f"Session {session_id} revoked successfully",
+            "Session %s revoked successfully",
+            session_id,
             user_id=current_user.id,
             session_id=session_id,
             ip_address=client_ip,
@@ -553,12 +674,14 @@ async def revoke_session(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(
-            f"Session revocation failed for session {session_id}",
-            user_id=current_user.id,
-            session_id=session_id,
-            ip_address=get_client_ip(request),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Session revocation failed for session %s",
+                session_id,
+                user_id=current_user.id,
+                session_id=session_id,
+                ip_address=client_ip,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
         raise DatabaseError("Session revocation failed")
@@ -1,10 +1,12 @@
 # user_backend/app/api/v1/endpoints/files.py
 # ============================================================================
 
+import hashlib
 import os
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Tuple
+from anyio import CapacityLimiter, to_thread
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
@@ -25,6 +27,13 @@ logger = StructuredLogger(__name__)
 # File upload settings
 UPLOAD_DIR = Path("uploads")
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per read/write/digest step
+FILE_TOO_LARGE_DETAIL = f"File too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB"
+
+# Upload copies get their own worker slots: the default threadpool also runs
+# every sync dependency (get_db, get_current_token, ...), so a burst of large
+# uploads must not be able to occupy all of it
+UPLOAD_WRITE_LIMITER = CapacityLimiter(8)
 ALLOWED_EXTENSIONS = {
     ".py",
     ".js",
@@ -43,11 +52,6 @@ ALLOWED_EXTENSIONS = {
 }
 
 
-def ensure_upload_directory():
-    """Ensure upload directory exists"""
-    UPLOAD_DIR.mkdir(exist_ok=True)
-
-
 def validate_file(file: UploadFile) -> None:
     """Validate uploaded file"""
     if not file.filename:
@@ -68,10 +72,70 @@ def validate_file(file: UploadFile) -> None:
     if content_length and content_length > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB",
+            detail=FILE_TOO_LARGE_DETAIL,
         )
 
 
+def user_project_ids(user_id: int):
+    """Subquery of the user's project ids, for ownership checks as a semi-join"""
+    return select(Project.id).where(Project.user_id == user_id)
+
+
+def create_unique_file(directory: Path, filename: str) -> Tuple[Path, BinaryIO]:
+    """
+    Create a new file in directory, adding _1, _2, ... to the name on clashes.
+    O_EXCL makes the existence check and the creation one step, so concurrent
+    uploads of the same name can never claim the same path
+    """
+    base_name = Path(filename).stem
+    extension = Path(filename).suffix
+    counter = 1
+    file_path = directory / filename
+
+    while True:
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            file_path = directory / f"{base_name}_{counter}{extension}"
+            counter += 1
+        else:
+            return file_path, os.fdopen(fd, "wb")
+
+
+def save_upload(
+    source: BinaryIO, directory: Path, filename: str
+) -> Tuple[Path, int, str]:
+    """
+    Claim a unique path for filename in directory and copy the upload into it
+    in chunks, returning the path, size and sha256 checksum. Only one chunk is
+    held in memory at a time, and the size limit is enforced on the bytes
+    actually received since the declared size is optional. Meant to run in a
+    worker thread: the file is created, written and closed there, and removed
+    again if the copy fails
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    file_path, destination = create_unique_file(directory, filename)
+
+    digest = hashlib.sha256()
+    file_size = 0
+    try:
+        with destination as buffer:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=FILE_TOO_LARGE_DETAIL,
+                    )
+                buffer.write(chunk)
+                digest.update(chunk)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
+
+    return file_path, file_size, digest.hexdigest()
+
+
 @router.post("/upload", response_model=FileUploadResponseSchema)
 async def upload_file(
     project_id: int,
@@ -95,33 +159,20 @@ async def upload_file(
 
     # Validate file
     validate_file(file)
-    ensure_upload_directory()
 
-    # Create unique file path
     user_dir = UPLOAD_DIR / f"user_{current_user.id}" / f"project_{project_id}"
-    user_dir.mkdir(parents=True, exist_ok=True)
-
-    # Handle filename conflicts
-    base_name = Path(file.filename).stem
-    extension = Path(file.filename).suffix
-    counter = 1
-    file_path = user_dir / file.filename
-
-    while file_path.exists():
-        new_filename = f"{base_name}_{counter}{extension}"
-        file_path = user_dir / new_filename
-        counter += 1
+    file_path = None
 
     try:
-        # Save file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-
-        # Calculate checksum
-        import hashlib
-
-        checksum = hashlib.sha256(content).hexdigest()
+        # Create, name and fill the file off the event loop so concurrent
+        # uploads interleave; the worker removes it if the copy fails
+        file_path, file_size, checksum = await to_thread.run_sync(
+            save_upload,
+            file.file,
+            user_dir,
+            file.filename,
+            limiter=UPLOAD_WRITE_LIMITER,
+        )
 
         # Create database record
         project_file = ProjectFile(
@@ -129,7 +180,7 @@ async def upload_file(
             filename=file_path.name,
             file_path=str(file_path),
             file_type=file_type,
-            file_size=len(content),
+            file_size=file_size,
             mime_type=file.content_type,
             checksum=checksum,
             is_generated=False,
@@ -144,7 +195,7 @@ async def upload_file(
             user_id=current_user.id,
             project_id=project_id,
             file_id=project_file.id,
-            file_size=len(content),
+            file_size=file_size,
         )
 
         return FileUploadResponseSchema(
@@ -157,10 +208,13 @@ async def upload_file(
             uploaded_at=project_file.uploaded_at,
         )
 
+    except HTTPException:
+        # Oversized upload; save_upload already dropped the partial file
+        raise
     except Exception as e:
         # Clean up file if database operation fails
-        if file_path.exists():
-            file_path.unlink()
+        if file_path is not None:
+            file_path.unlink(missing_ok=True)
 
         db.rollback()
         logger.error(f"File upload failed: {str(e)}")
@@ -179,9 +233,10 @@ async def download_file(
     """Download file"""
     # Get file with project ownership check
     file_record = db.execute(
-        select(ProjectFile)
-        .join(Project)
-        .where(ProjectFile.id == file_id, Project.user_id == current_user.id)
+        select(ProjectFile).where(
+            ProjectFile.id == file_id,
+            ProjectFile.project_id.in_(user_project_ids(current_user.id)),
+        )
     ).scalar_one_or_none()
 
     if not file_record:
@@ -189,17 +244,24 @@ async def download_file(
             status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
         )
 
-    file_path = Path(file_record.file_path)
-    if not file_path.exists():
+    # Stat once here and hand the result to FileResponse, which would
+    # otherwise stat the file again from a worker thread
+    try:
+        stat_result = os.stat(file_record.file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="File not found on disk"
         )
 
-    return FileResponse(
-        path=str(file_path),
+    response = FileResponse(
+        path=file_record.file_path,
         filename=file_record.filename,
         media_type=file_record.mime_type or "application/octet-stream",
+        stat_result=stat_result,
     )
+    # Each chunk is one threadpool read; 1MB instead of 64KB cuts the hops
+    response.chunk_size = UPLOAD_CHUNK_SIZE
+    return response
 
 
 @router.delete("/{file_id}")
@@ -211,9 +273,10 @@ async def delete_file(
     """Delete file"""
     # Get file with project ownership check
     file_record = db.execute(
-        select(ProjectFile)
-        .join(Project)
-        .where(ProjectFile.id == file_id, Project.user_id == current_user.id)
+        select(ProjectFile).where(
+            ProjectFile.id == file_id,
+            ProjectFile.project_id.in_(user_project_ids(current_user.id)),
+        )
     ).scalar_one_or_none()
 
     if not file_record:
@@ -239,7 +302,9 @@ async def delete_file(
 
 import psutil
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -261,6 +326,24 @@ from user_backend.app.core.logging_config import StructuredLogger
 router = APIRouter(tags=["system"], prefix="/system")
 logger = StructuredLogger(__name__)
 
+# cpu_percent(interval=None) reports usage since the previous call instead of
+# sleeping to sample; prime it so the first /metrics request has a baseline
+psutil.cpu_percent(interval=None)
+
+
+@lru_cache(maxsize=1)
+def _host_usage(second: int):
+    """Memory and root disk usage; the argument only keys the cache"""
+    return psutil.virtual_memory(), psutil.disk_usage("/")
+
+
+def host_usage():
+    """
+    (virtual_memory, disk_usage) shared by /status and /metrics, read from
+    /proc and statvfs at most once per second however often they are probed
+    """
+    return _host_usage(int(time.monotonic()))
+
 
 @router.get("/health", response_model=HealthCheckSchema)
 async def health_check(db: Session = Depends(get_db)):
@@ -323,7 +406,7 @@ async def system_status(db: Session = Depends(get_db)):
     services.append(storage_status)
 
     # Memory usage
-    memory = psutil.virtual_memory()
+    memory, _ = host_usage()
     memory_status = "healthy" if memory.percent < 80 else "degraded"
     if memory.percent > 95:
         memory_status = "down"
@@ -449,9 +532,8 @@ async def get_system_metrics():
     """Get system performance metrics"""
     try:
         # System metrics
-        memory = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=1)
-        disk = psutil.disk_usage("/")
+        memory, disk = host_usage()
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         return {
             "cpu_usage": cpu_percent,
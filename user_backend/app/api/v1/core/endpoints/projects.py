@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, desc
 from user_backend.app.db_setup import get_db
 from user_backend.app.core.security import get_current_active_user
+from user_backend.app.core.responses import json_response
 from user_backend.app.api.v1.core.models import (
     FileType,
     GenerationStatus,
@@ -68,7 +69,6 @@ async def create_project(
 
         db.add(new_project)
         db.commit()
-        db.refresh(new_project)
 
         # Log activity
         background_tasks.add_task(
@@ -86,7 +86,10 @@ async def create_project(
             project_id=new_project.id,
         )
 
-        return ProjectOutSchema.model_validate(new_project)
+        return json_response(
+            ProjectOutSchema.model_validate(new_project),
+            status_code=status.HTTP_201_CREATED,
+        )
 
     except Exception as e:
         db.rollback()
@@ -123,7 +126,6 @@ async def update_project(
         setattr(project, field, value)
 
     db.commit()
-    db.refresh(project)
 
     background_tasks.add_task(
         log_user_activity,
@@ -134,7 +136,7 @@ async def update_project(
         project.id,
     )
 
-    return ProjectOutSchema.model_validate(project)
+    return json_response(ProjectOutSchema.model_validate(project))
 
 
 @router.delete("/{project_id}")
@@ -221,7 +223,7 @@ async def generate_project(
         await run_code_generation(generation.id, project.id, current_user.id)
         db.refresh(generation)
 
-    return ProjectGenerationOutSchema.model_validate(generation)
+    return json_response(ProjectGenerationOutSchema.model_validate(generation))
 
 
 @router.get(
@@ -453,7 +455,7 @@ async def get_project(
             status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
         )
 
-    return convert_project_to_schema(project)
+    return json_response(convert_project_to_schema(project))
 
 
 # REPLACE your existing list_projects function with this:
@@ -2,9 +2,11 @@
 # ============================================================================
 
 from typing import List, Optional
+from cachetools import TTLCache
+from pydantic import TypeAdapter
 from requests import Session
-from sqlalchemy import desc, select
-from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import desc, select, update
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from user_backend.app.api.v1.core.models import (
     Project,
@@ -19,14 +21,33 @@ from user_backend.app.api.v1.core.schemas import (
     TemplateUseSchema,
 )
 from user_backend.app.core.security import get_current_active_user
+from user_backend.app.core.responses import (
+    conditional_json_response,
+    json_response,
+    make_etag,
+)
 from user_backend.app.db_setup import get_db
 
 
 router = APIRouter(tags=["templates"], prefix="/templates")
 
+# Serialized listing bodies and their ETags, keyed by endpoint and query
+# params. Only use_template changes the ordering, and it clears the cache
+TEMPLATE_LIST_CACHE: TTLCache = TTLCache(maxsize=256, ttl=30)
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[ProjectTemplateOutSchema])
+
+
+def _template_list_entry(templates) -> tuple:
+    """Serialized body and ETag for a template listing"""
+    body = _TEMPLATE_LIST_ADAPTER.dump_json(
+        [ProjectTemplateOutSchema.model_validate(t) for t in templates]
+    )
+    return body, make_etag(body)
+
 
 @router.get("/", response_model=List[ProjectTemplateOutSchema])
 async def list_templates(
+    request: Request,
     project_type: Optional[ProjectType] = None,
     category: Optional[TokenCategory] = None,
     featured_only: bool = False,
@@ -35,6 +56,11 @@ async def list_templates(
     db: Session = Depends(get_db),
 ):
     """List available project templates"""
+    cache_key = ("list", project_type, category, featured_only, limit, offset)
+    entry = TEMPLATE_LIST_CACHE.get(cache_key)
+    if entry is not None:
+        return conditional_json_response(request, *entry)
+
     query = select(ProjectTemplate).where(ProjectTemplate.is_public)
 
     if project_type:
@@ -47,12 +73,20 @@ async def list_templates(
     )
 
     templates = db.execute(query).scalars().all()
-    return [ProjectTemplateOutSchema.model_validate(t) for t in templates]
+    entry = TEMPLATE_LIST_CACHE[cache_key] = _template_list_entry(templates)
+    return conditional_json_response(request, *entry)
 
 
 @router.get("/popular", response_model=List[ProjectTemplateOutSchema])
-async def get_popular_templates(limit: int = 10, db: Session = Depends(get_db)):
+async def get_popular_templates(
+    request: Request, limit: int = 10, db: Session = Depends(get_db)
+):
     """Get most popular templates"""
+    cache_key = ("popular", limit)
+    entry = TEMPLATE_LIST_CACHE.get(cache_key)
+    if entry is not None:
+        return conditional_json_response(request, *entry)
+
     templates = (
         db.execute(
             select(ProjectTemplate)
@@ -64,7 +98,8 @@ async def get_popular_templates(limit: int = 10, db: Session = Depends(get_db)):
         .all()
     )
 
-    return [ProjectTemplateOutSchema.model_validate(t) for t in templates]
+    entry = TEMPLATE_LIST_CACHE[cache_key] = _template_list_entry(templates)
+    return conditional_json_response(request, *entry)
 
 
 @router.post("/{template_id}/use", response_model=ProjectOutSchema)
@@ -100,10 +135,16 @@ async def use_template(
 
     db.add(new_project)
 
-    # Increment template usage
-    template.usage_count += 1
+    # Increment template usage server-side so concurrent uses are not lost
+    db.execute(
+        update(ProjectTemplate)
+        .where(ProjectTemplate.id == template_id)
+        .values(usage_count=ProjectTemplate.usage_count + 1)
+        .execution_options(synchronize_session=False)
+    )
 
     db.commit()
-    db.refresh(new_project)
+    # usage_count orders every listing
+    TEMPLATE_LIST_CACHE.clear()
 
-    return ProjectOutSchema.model_validate(new_project)
+    return json_response(ProjectOutSchema.model_validate(new_project))
@@ -76,17 +76,21 @@ async def validate_tokens(
 ):
     """Validate token combination - ADMIN ONLY"""
     tokens = validation_data.tokens
-    token_defs = (
-        db.execute(select(TokenDefinition).where(TokenDefinition.token.in_(tokens)))
-        .scalars()
-        .all()
-    )
+    tokens_set = frozenset(tokens)
+    # Only the columns the checks below read
+    token_defs = db.execute(
+        select(
+            TokenDefinition.token,
+            TokenDefinition.dependencies,
+            TokenDefinition.conflicts_with,
+        ).where(TokenDefinition.token.in_(tokens_set))
+    ).all()
 
     found_tokens = {t.token: t for t in token_defs}
     errors = []
     warnings = []
     suggestions = []
-    missing_dependencies = []
+    missing_dependencies = set()
     conflicts = []
 
     # Check if all tokens exist
@@ -100,14 +104,14 @@ async def validate_tokens(
             token_def = found_tokens[token]
 
             for dep in token_def.dependencies:
-                if dep not in tokens:
-                    missing_dependencies.append(dep)
+                if dep not in tokens_set:
+                    missing_dependencies.add(dep)
                     suggestions.append(
                         f"Consider adding '{dep}' as it's required by '{token}'"
                     )
 
             for conflict in token_def.conflicts_with:
-                if conflict in tokens:
+                if conflict in tokens_set:
                     conflicts.append(f"Token '{token}' conflicts with '{conflict}'")
 
     is_valid = len(errors) == 0 and len(conflicts) == 0
@@ -117,7 +121,7 @@ async def validate_tokens(
         errors=errors,
         warnings=warnings,
         suggestions=suggestions,
-        missing_dependencies=list(set(missing_dependencies)),
+        missing_dependencies=list(missing_dependencies),
         conflicts=conflicts,
     )
 
@@ -131,32 +135,31 @@ async def get_token_analytics(
     """Get token usage analytics - ADMIN ONLY"""
     logger.info(f"Admin token analytics request from user {current_user.id}")
 
+    # One grouped join instead of a definition lookup per usage row; usage of
+    # tokens without a definition is dropped by the inner join
     token_usage = db.execute(
-        select(TokenUsage.token, func.sum(TokenUsage.usage_count).label("total_usage"))
-        .group_by(TokenUsage.token)
+        select(
+            TokenDefinition.token,
+            TokenDefinition.name,
+            func.sum(TokenUsage.usage_count).label("total_usage"),
+        )
+        .join(TokenUsage, TokenUsage.token == TokenDefinition.token)
+        .group_by(TokenDefinition.token, TokenDefinition.name)
         .order_by(desc("total_usage"))
         .limit(limit)
     ).all()
 
-    analytics = []
-    for token, usage in token_usage:
-        token_def = db.execute(
-            select(TokenDefinition).where(TokenDefinition.token == token)
-        ).scalar_one_or_none()
-
-        if token_def:
-            analytics.append(
-                TokenAnalyticsSchema(
-                    token=token,
-                    name=token_def.name,
-                    usage_count=usage,
-                    success_rate=0.95,
-                    avg_generation_time=2.5,
-                    most_combined_with=[],
-                )
-            )
-
-    return analytics
+    return [
+        TokenAnalyticsSchema(
+            token=token,
+            name=name,
+            usage_count=usage,
+            success_rate=0.95,
+            avg_generation_time=2.5,
+            most_combined_with=[],
+        )
+        for token, name, usage in token_usage
+    ]
 
 
 # ============================================================================
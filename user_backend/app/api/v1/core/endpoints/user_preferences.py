@@ -13,6 +13,7 @@ from user_backend.app.api.v1.core.schemas import (
     MessageResponseSchema,
 )
 from user_backend.app.core.security import get_current_active_user
+from user_backend.app.core.responses import json_response
 from user_backend.app.db_setup import get_db
 from user_backend.app.core.logging_config import StructuredLogger
 
@@ -37,7 +38,7 @@ async def get_user_preferences(
         db.commit()
         db.refresh(preferences)
 
-    return UserPreferencesOutSchema.model_validate(preferences)
+    return json_response(UserPreferencesOutSchema.model_validate(preferences))
 
 
 @router.put("/preferences", response_model=UserPreferencesOutSchema)
@@ -69,7 +70,7 @@ async def update_user_preferences(
         updated_fields=list(update_data.keys()),
     )
 
-    return UserPreferencesOutSchema.model_validate(preferences)
+    return json_response(UserPreferencesOutSchema.model_validate(preferences))
 
 
 @router.get("/usage")
@@ -1,11 +1,11 @@
 # user_backend/app/api/v1/endpoints/websockets.py
 # ============================================================================
 
-import json
 import asyncio
 from datetime import datetime
 from typing import Dict, List
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
+import orjson
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -22,6 +22,19 @@ from user_backend.app.core.logging_config import StructuredLogger
 router = APIRouter(tags=["websockets"], prefix="/ws")
 logger = StructuredLogger(__name__)
 
+# Reported by /system-status on every tick
+SYSTEM_SERVICES = {
+    "database": "healthy",
+    "file_storage": "healthy",
+    "ai_service": "healthy",
+    "generation_queue": "healthy",
+}
+
+
+def _dumps(message: dict) -> str:
+    """Serialize with orjson; still sent as a text frame for browser JSON clients"""
+    return orjson.dumps(message).decode()
+
 
 class ConnectionManager:
     """Manages WebSocket connections"""
@@ -67,9 +80,10 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, user_id: int):
         """Send message to specific user"""
         if user_id in self.active_connections:
+            payload = _dumps(message)
             for connection in self.active_connections[user_id]:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await connection.send_text(payload)
                 except:
                     # Connection is closed, will be cleaned up on next disconnect
                     pass
@@ -77,19 +91,21 @@ class ConnectionManager:
     async def send_project_message(self, message: dict, project_id: int):
         """Send message to all users watching a project"""
         if project_id in self.project_connections:
+            payload = _dumps(message)
             for connection in self.project_connections[project_id]:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await connection.send_text(payload)
                 except:
                     # Connection is closed, will be cleaned up on next disconnect
                     pass
 
     async def broadcast_to_all(self, message: dict):
         """Broadcast message to all connected users"""
+        payload = _dumps(message)
         for user_id, connections in self.active_connections.items():
             for connection in connections:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await connection.send_text(payload)
                 except:
                     # Connection is closed, will be cleaned up on next disconnect
                     pass
@@ -123,7 +139,7 @@ async def websocket_notifications(
 
         for notification in unread_notifications:
             await websocket.send_text(
-                json.dumps(
+                _dumps(
                     {
                         "type": "notification",
                         "data": {
@@ -142,7 +158,7 @@ async def websocket_notifications(
         # Keep connection alive
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
 
             if message.get("type") == "mark_read":
                 notification_id = message.get("notification_id")
@@ -159,7 +175,7 @@ async def websocket_notifications(
                         db.commit()
 
                         await websocket.send_text(
-                            json.dumps(
+                            _dumps(
                                 {
                                     "type": "notification_read",
                                     "data": {"notification_id": notification_id},
@@ -208,7 +224,7 @@ async def websocket_project_generation(
 
         if latest_generation:
             await websocket.send_text(
-                json.dumps(
+                _dumps(
                     {
                         "type": "generation_status",
                         "data": {
@@ -251,18 +267,13 @@ async def websocket_system_status(websocket: WebSocket):
                 "type": "system_status",
                 "data": {
                     "timestamp": datetime.utcnow().isoformat(),
-                    "services": {
-                        "database": "healthy",
-                        "file_storage": "healthy",
-                        "ai_service": "healthy",
-                        "generation_queue": "healthy",
-                    },
+                    "services": SYSTEM_SERVICES,
                     "active_generations": 0,  # TODO: Get actual count
                     "queue_length": 0,  # TODO: Get actual queue length
                 },
             }
 
-            await websocket.send_text(json.dumps(status_message))
+            await websocket.send_text(_dumps(status_message))
             await asyncio.sleep(30)
 
     except WebSocketDisconnect:
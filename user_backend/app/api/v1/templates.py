@@ -4,8 +4,10 @@ import json
 import os
 import shutil
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from pydantic import TypeAdapter
 import logging
 import zipfile
 import tempfile
@@ -22,11 +24,21 @@ from user_backend.app.schemas import (
     TemplateUseSchema,
 )
 from user_backend.app.core.security import get_current_active_user
+from user_backend.app.core.responses import (
+    conditional_json_response,
+    json_response,
+    make_etag,
+)
 from user_backend.app.db_setup import get_db
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Serialized listing bodies and their ETags keyed by query params, so repeat
+# listings skip re-reading every template.json; templates only change on deploy
+TEMPLATE_LIST_CACHE: TTLCache = TTLCache(maxsize=256, ttl=30)
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[ProjectTemplateOutSchema])
+
 # Correct path: templates are in /app/templates within the container
 TEMPLATES_DIR = Path("/app/templates")
 
@@ -72,6 +84,7 @@ def get_template_metadata(template_dir: Path) -> Optional[dict]:
 
 @router.get("/", response_model=List[ProjectTemplateOutSchema])
 async def list_templates(
+    request: Request,
     project_type: Optional[ProjectType] = Query(None),
     category: Optional[TokenCategory] = Query(None),
     featured_only: bool = Query(False),
@@ -79,6 +92,11 @@ async def list_templates(
     offset: int = Query(0, ge=0),
 ):
     """List available project templates from filesystem directories"""
+    cache_key = (project_type, category, featured_only, limit, offset)
+    entry = TEMPLATE_LIST_CACHE.get(cache_key)
+    if entry is not None:
+        return conditional_json_response(request, *entry)
+
     templates = []
 
     logger.info(f"Listing templates from: {TEMPLATES_DIR}")
@@ -123,7 +141,9 @@ async def list_templates(
     # Apply pagination
     start_idx = offset
     end_idx = offset + limit
-    return templates[start_idx:end_idx]
+    body = _TEMPLATE_LIST_ADAPTER.dump_json(templates[start_idx:end_idx])
+    entry = TEMPLATE_LIST_CACHE[cache_key] = (body, make_etag(body))
+    return conditional_json_response(request, *entry)
 
 
 @router.get("/{template_name}/preview")
@@ -344,9 +364,8 @@ async def use_template(
 
     db.add(new_project)
     db.commit()
-    db.refresh(new_project)
 
-    return ProjectOutSchema.model_validate(new_project)
+    return json_response(ProjectOutSchema.model_validate(new_project))
 
 
 @router.get("/health")
@@ -164,25 +164,38 @@ class StructuredLogger:
     def __init__(self, logger_name: str):
         self.logger = logging.getLogger(logger_name)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info with structured data"""
-        extra = self._prepare_extra(**kwargs)
-        self.logger.info(message, extra=extra)
+        self._log(logging.INFO, message, args, kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning with structured data"""
-        extra = self._prepare_extra(**kwargs)
-        self.logger.warning(message, extra=extra)
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error with structured data"""
-        extra = self._prepare_extra(**kwargs)
-        self.logger.error(message, extra=extra)
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug with structured data"""
-        extra = self._prepare_extra(**kwargs)
-        self.logger.debug(message, extra=extra)
+        self._log(logging.DEBUG, message, args, kwargs)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Guard for callers whose structured fields are costly to build"""
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: Dict[str, Any]):
+        # Positional args are %-formatted by logging only if a handler emits the
+        # record; below the level nothing is built at all. stacklevel=3 points
+        # filename/lineno/funcName at the caller of info()/error()/...
+        if self.logger.isEnabledFor(level):
+            self.logger.log(
+                level,
+                message,
+                *args,
+                extra=self._prepare_extra(**kwargs),
+                stacklevel=3,
+            )
 
     def _prepare_extra(self, **kwargs) -> Dict[str, Any]:
         """Prepare extra data for logging"""
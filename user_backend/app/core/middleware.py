@@ -116,7 +116,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Check for common proxy headers
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+            return forwarded_for.partition(",")[0].strip()
 
         real_ip = request.headers.get("X-Real-IP")
         if real_ip:
@@ -200,7 +200,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Extract client IP address"""
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+            return forwarded_for.partition(",")[0].strip()
 
         real_ip = request.headers.get("X-Real-IP")
         if real_ip:
@@ -310,7 +310,7 @@ class ErrorTrackingMiddleware(BaseHTTPMiddleware):
         """Extract client IP address"""
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+            return forwarded_for.partition(",")[0].strip()
 
         real_ip = request.headers.get("X-Real-IP")
         if real_ip:
@@ -0,0 +1,34 @@
+# user_backend/app/core/responses.py
+
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a schema with pydantic's Rust serializer straight into a Response,
+    skipping FastAPI's response_model re-validation and jsonable_encoder pass
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Serve pre-serialized JSON with its ETag, or an empty 304 when the client's
+    If-None-Match already names it
+    """
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -6,8 +6,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Annotated, Optional, Dict, Any
 from passlib.context import CryptContext
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select, delete
+from sqlalchemy import Row, delete, insert, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from user_backend.app.db_setup import get_db
@@ -113,8 +114,11 @@ class SecurityService:
         db: Session,
         token_type: str = "access",
         expire_minutes: Optional[int] = None,
-    ) -> Token:
-        """Create and store database token with error handling"""
+    ) -> Row:
+        """Create and store database token with error handling
+
+        Returns the inserted (id, token, user_id, expire_date) row.
+        """
         try:
             if expire_minutes is None:
                 expire_minutes = (
@@ -126,13 +130,13 @@ class SecurityService:
             token_value = self.generate_secure_token()
             expire_date = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
 
-            new_token = Token(
-                token=token_value, user_id=user_id, expire_date=expire_date
-            )
-
-            db.add(new_token)
+            # Single INSERT ... RETURNING; no ORM object to flush and refresh
+            new_token = db.execute(
+                insert(Token)
+                .values(token=token_value, user_id=user_id, expire_date=expire_date)
+                .returning(Token.id, Token.token, Token.user_id, Token.expire_date)
+            ).one()
             db.commit()
-            db.refresh(new_token)
 
             logger.info(
                 f"Token created for user {user_id}",
@@ -202,26 +206,41 @@ class SecurityService:
             raise AuthenticationError("Token verification failed")
 
     # User authentication
-    def authenticate_user(
+    async def authenticate_user(
         self, email: str, password: str, db: Session, ip_address: str = "unknown"
-    ) -> User:
-        """Authenticate user with brute force protection"""
+    ) -> Row:
+        """Authenticate user with brute force protection
+
+        Returns the matching (id, email, hashed_password) row. Runs on the
+        event loop; only the password hash check goes to a worker thread, so
+        failed_attempts is never touched from two threads at once.
+        """
         try:
             # Check for account lockout
             if self._is_account_locked(email):
                 raise AccountLockedException()
 
             # Find user by email
-            user = db.execute(select(User).where(User.email == email)).scalars().first()
+            # Only the columns login needs; skips hydrating a full User
+            user = db.execute(
+                select(User.id, User.email, User.hashed_password)
+                .where(User.email == email)
+                .limit(1)
+            ).first()
 
             if not user:
                 self._record_failed_attempt(email, ip_address)
                 security_logger.log_failed_login(email, ip_address)
                 raise InvalidCredentialsError()
 
-            # Verify password
-            if not self.verify_password(password, user.hashed_password):
-                self._record_failed_attempt(email, ip_address)
+            # Count the attempt before yielding to the hash check, so guesses
+            # still in flight already count toward the lockout; success clears it
+            self._record_failed_attempt(email, ip_address)
+
+            # Verify password (CPU-bound, keep it off the event loop)
+            if not await run_in_threadpool(
+                self.verify_password, password, user.hashed_password
+            ):
                 security_logger.log_failed_login(email, ip_address)
                 raise InvalidCredentialsError()
 
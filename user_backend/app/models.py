@@ -4,14 +4,17 @@ from typing import List, Optional, Any, Dict
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy import (
+    DDL,
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Float,
     Text,
     UniqueConstraint,
+    event,
     func,
     Enum as SQLEnum,
 )
@@ -43,6 +46,11 @@ class Token(Base):
     # Relationship
     user: Mapped["User"] = relationship(back_populates="tokens")
 
+    # Session listing filters on user_id and expiry
+    __table_args__ = (
+        Index("ix_tokens_user_id_expire_date", "user_id", "expire_date"),
+    )
+
 
 # ----- User -----
 
@@ -128,6 +136,12 @@ class ProjectType(str, Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    # Fetch created_at/updated_at via RETURNING in the INSERT/UPDATE itself,
+    # so handlers can serialize a new or edited project without a refresh
+    __mapper_args__ = {"eager_defaults": True}
+    # Ownership probes and per-user listings filter on user_id; carrying id
+    # lets "id IN (projects of this user)" be answered from the index alone
+    __table_args__ = (Index("ix_projects_user_id_id", "user_id", "id"),)
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
@@ -227,6 +241,28 @@ class TokenComplexity(str, Enum):
 
 class TokenDefinition(Base):
     __tablename__ = "token_definitions"
+    # Trigram GIN indexes let the catalog search's ILIKE '%term%' predicates
+    # use an index instead of scanning every row
+    __table_args__ = (
+        Index(
+            "ix_token_definitions_token_trgm",
+            "token",
+            postgresql_using="gin",
+            postgresql_ops={"token": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_token_definitions_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_token_definitions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     token: Mapped[str] = mapped_column(
         String(10), unique=True, index=True, nullable=False
@@ -256,6 +292,14 @@ class TokenDefinition(Base):
         return f"<TokenDefinition {self.token}: {self.name}>"
 
 
+# gin_trgm_ops comes from pg_trgm, which must exist before the indexes above
+event.listen(
+    TokenDefinition.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class TokenCombination(Base):
     __tablename__ = "token_combinations"
 
@@ -331,7 +375,6 @@ class AIConversation(Base):
     )
 
     # Conversation data
-    messages: Mapped[List[Dict[str, Any]]] = mapped_column(JSONB, default=[])
     context: Mapped[Dict[str, Any]] = mapped_column(JSONB, default={})
 
     # Status
@@ -341,6 +384,37 @@ class AIConversation(Base):
         DateTime, server_default=func.now(), onupdate=func.now()
     )
 
+    # Messages live in their own table so each one is a single INSERT.
+    # Lazy loads raise: read histories with selectinload(AIConversation.messages)
+    # so listing conversations can never fall into one query per row. Deletes
+    # are left to the database's ON DELETE CASCADE instead of loading children
+    messages: Mapped[List["AIMessage"]] = relationship(
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="AIMessage.id",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+
+
+class AIMessage(Base):
+    __tablename__ = "ai_messages"
+    # Serves the selectinload query (conversation_id IN (...) ORDER BY id)
+    __table_args__ = (
+        Index("ix_ai_messages_conversation_id_id", "conversation_id", "id"),
+    )
+
+    conversation_id: Mapped[int] = mapped_column(
+        ForeignKey("ai_conversations.id", ondelete="CASCADE")
+    )
+    role: Mapped[str] = mapped_column(String(20))  # user, assistant
+    content: Mapped[str] = mapped_column(Text)
+    # Both messages of an exchange share the transaction's now()
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    suggested_features: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)
+
+    conversation: Mapped["AIConversation"] = relationship(back_populates="messages")
+
 
 class AIInsightType(str, Enum):
     TOKEN_SUGGESTION = "token_suggestion"
@@ -381,6 +455,7 @@ class FileType(str, Enum):
 
 class ProjectFile(Base):
     __tablename__ = "project_files"
+    __table_args__ = (Index("ix_project_files_project_id", "project_id"),)
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE")